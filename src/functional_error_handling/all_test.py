@@ -5,15 +5,38 @@
 # python -m pytest
 # or
 # python all_test.py
+# or, in parallel warm workers with a timing report:
+# python all_test.py --parallel
+# Scripts that passed and haven't changed (nor have their
+# local imports or dependencies) are skipped. Rerun all with:
+# python all_test.py --force
+# or set ALL_TEST_FORCE=1 (e.g. for pytest)
 import os
 import subprocess
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))  # For pytest
+from script_cache import ScriptCache, script_key  # noqa: E402
+
+force = "--force" in sys.argv or bool(
+    os.environ.get("ALL_TEST_FORCE")
+)
+script_cache = ScriptCache()
+
 
 def run_script(file_name, throws_exception=False):
     "Run a Python script using subprocess and assert it exits sucessfully"
     script_path = Path(__file__).parent / file_name
+    key = script_key(script_path)
+    if not force and script_cache.unchanged(file_name, key):
+        message = f"{file_name} unchanged, skipped"
+        if "pytest" in sys.modules:  # So it reports a skip, not a pass
+            import pytest
+
+            pytest.skip(message)
+        print(message)
+        return
     env = os.environ.copy()
     # env["PYTHONPATH"] = str(
     #     Path(__file__).parent
@@ -32,6 +55,7 @@ def run_script(file_name, throws_exception=False):
         assert (
             result.returncode == 0
         ), f"Script {file_name} failed with output:\n{result.stdout}\n{result.stderr}"
+    script_cache.record(file_name, key)
     print(f"{file_name} completed")
 
 
@@ -59,10 +83,95 @@ def test_example6():
     run_script("example6.py")
 
 
+def test_result_lib():
+    run_script("result_lib.py")
+
+
+def test_result_tools():
+    run_script("result_tools.py")
+
+
+def test_result_batch():
+    run_script("result_batch.py")
+
+
+def test_async_result():
+    run_script("async_result.py")
+
+
+def test_parallel():
+    run_script("parallel.py")
+
+
+def test_result_stream():
+    run_script("result_stream.py")
+
+
+def test_memoize():
+    run_script("memoize.py")
+
+
+def test_result_list():
+    run_script("result_list.py")
+
+
+def test_bind_metrics():
+    run_script("bind_metrics.py")
+
+
+def test_failure_origin():
+    run_script("failure_origin.py")
+
+
+def test_validate_output():
+    run_script("validate_output.py")
+
+
 if __name__ == "__main__":
+    if "--parallel" in sys.argv:
+        import time
+
+        from script_runner import report, run_scripts
+
+        # Each test_name() runs name.py:
+        scripts = {
+            name.removeprefix("test_") + ".py": False
+            for name in list(globals())
+            if name.startswith("test_")
+        }
+        scripts["example1.py"] = True  # Expected exception
+        keys = {
+            name: script_key(Path(__file__).parent / name)
+            for name in scripts
+        }
+        if not force:
+            for name, key in keys.items():
+                if script_cache.unchanged(name, key):
+                    print(f"{name} unchanged, skipped")
+                    del scripts[name]
+        start = time.perf_counter()
+        runs = run_scripts(scripts)
+        for run in runs:
+            if run.passed:
+                key = keys[run.file_name]
+                script_cache.record(run.file_name, key)
+        if not report(runs, time.perf_counter() - start):
+            sys.exit(1)
+        sys.exit(0)
     test_example1()
     test_example2()
     test_example3()
     test_example4()
     test_example5()
     test_example6()
+    test_result_lib()
+    test_result_tools()
+    test_result_batch()
+    test_async_result()
+    test_parallel()
+    test_result_stream()
+    test_memoize()
+    test_result_list()
+    test_bind_metrics()
+    test_failure_origin()
+    test_validate_output()
@@ -0,0 +1,132 @@
+#: async_result.py
+# Awaitable Result for stages that do I/O
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Iterable,
+    List,
+)
+
+from result_lib import ANSWER, ERROR, Result, Success
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+class AsyncResult(Generic[ANSWER, ERROR]):
+    "Wraps an awaitable Result; await it once to get the Result"
+
+    __slots__ = ("awaitable",)
+
+    def __init__(self, awaitable: Awaitable[Result]):
+        self.awaitable = awaitable
+
+    @classmethod
+    def of(cls, result: Result[ANSWER, ERROR]) -> "AsyncResult":
+        async def ready() -> Result:
+            return result
+
+        return cls(ready())
+
+    def bind(
+        self, func: Callable[[ANSWER], Result]
+    ) -> "AsyncResult":
+        "Chain a synchronous stage"
+
+        async def run() -> Result:
+            return (await self.awaitable).bind(func)
+
+        return AsyncResult(run())
+
+    def bind_async(
+        self, func: Callable[[ANSWER], Awaitable[Result]]
+    ) -> "AsyncResult":
+        "Chain a coroutine stage without blocking the loop"
+
+        async def run() -> Result:
+            result = await self.awaitable
+            if result.success:
+                return await func(result.answer)  # type: ignore
+            return result  # Pass the Failure forward
+
+        return AsyncResult(run())
+
+    def __await__(self) -> Generator[Any, None, Result]:
+        return self.awaitable.__await__()
+
+
+async def gather(
+    composed: Callable[..., Awaitable[Result]],
+    inputs: Iterable[Any],
+    limit: int = 100,
+) -> List[Result]:
+    """
+    Run composed(input) for every input, at most `limit` at a
+    time. Results (Failures included) keep the input order.
+    Only `limit` workers exist, each pulling the next input, so
+    memory doesn't grow with the number of inputs in flight.
+    If composed raises, the other workers are cancelled.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, not {limit}")
+    results: List[Any] = []
+    source = iter(inputs)  # Shared by the workers
+
+    async def worker() -> None:
+        for arg in source:
+            index = len(results)  # Slot reserved in input order
+            results.append(None)
+            results[index] = await composed(arg)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(limit)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:  # Including our own cancellation
+        for task in workers:
+            task.cancel()
+        raise
+    return results
+
+
+if __name__ == "__main__":
+    from pprint import pprint
+
+    from result_lib import Failure
+    from validate_output import console
+
+    def func_a(i: int) -> Result[int, str]:
+        if i == 1:
+            return Failure(f"func_a({i})")
+        return Success(i)
+
+    async def func_b(i: int) -> Result[int, ValueError]:
+        await asyncio.sleep(0.01 * (5 - i))  # Finish out of order
+        if i == 2:
+            return Failure(ValueError(f"func_b({i})"))
+        return Success(i)
+
+    async def func_c(i: int) -> Result[int, ZeroDivisionError]:
+        await asyncio.sleep(0)
+        if i == 3:
+            return Failure(ZeroDivisionError(f"func_c({i})"))
+        return Success(i * 10)
+
+    def composed(i: int) -> AsyncResult[int, Any]:
+        # fmt: off
+        return (
+            AsyncResult.of(func_a(i))
+            .bind_async(func_b)
+            .bind_async(func_c)
+        )
+
+    pprint(asyncio.run(gather(composed, range(5), limit=2)))
+    console == """
+[<Success: 0>,
+ <Failure: func_a(1)>,
+ <Failure: func_b(2)>,
+ <Failure: func_c(3)>,
+ <Success: 40>]
+"""
@@ -0,0 +1,75 @@
+#: bench_combine.py
+# Result.combine vs returns' Result.do at several failure rates
+# python bench_combine.py
+import random
+import timeit
+
+import result_lib as local
+
+N = 20_000
+
+
+def add(first: int, second: int, third: int) -> int:
+    return first + second + third
+
+
+def make_stage(module, fails: set):
+    def stage(i: int):
+        if i in fails:
+            return module.Failure(f"stage({i})")
+        return module.Success(i)
+
+    return stage
+
+
+def inputs_for(rate: float) -> tuple[list, set]:
+    rng = random.Random(42)
+    inputs = list(range(N))
+    return inputs, set(rng.sample(inputs, int(N * rate)))
+
+
+def local_combine(stage, inputs):
+    combine = local.Result.combine
+    return [
+        combine(add, stage(i), stage(i), stage(i))
+        for i in inputs
+    ]
+
+
+def returns_do(result_type, stage, inputs):
+    # fmt: off
+    return [
+        result_type.do(
+            add(first, second, third)
+            for first in stage(i)
+            for second in stage(i)
+            for third in stage(i)
+        )
+        for i in inputs
+    ]
+
+
+def per_op_ns(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=5)) / N * 1e9
+
+
+if __name__ == "__main__":
+    try:
+        from returns import result as returns_result
+    except ImportError:
+        returns_result = None
+    print(f"{'fail %':<8}{'combine ns':>12}{'returns do ns':>15}")
+    for rate in [0.0, 0.01, 0.1, 0.5, 1.0]:
+        inputs, fails = inputs_for(rate)
+        stage = make_stage(local, fails)
+        ns = per_op_ns(lambda: local_combine(stage, inputs))
+        row = f"{rate:<8.0%}{ns:>12.1f}"
+        if returns_result is not None:
+            r_stage = make_stage(returns_result, fails)
+            ns = per_op_ns(
+                lambda: returns_do(
+                    returns_result.Result, r_stage, inputs
+                )
+            )
+            row += f"{ns:>15.1f}"
+        print(row)
@@ -0,0 +1,94 @@
+#: bench_compose.py
+# Per-call cost of compose() vs chained .bind(), with stages
+# returning Results and with Bare stages returning answers
+# python bench_compose.py
+import timeit
+
+from result_lib import Failure, Result, Success
+from result_tools import Bare, compose
+
+N = 200_000
+
+
+def func_a(i: int) -> Result[int, str]:
+    if i == 1:
+        return Failure(f"func_a({i})")
+    return Success(i)
+
+
+def func_b(i: int) -> Result[int, str]:
+    if i == 2:
+        return Failure(f"func_b({i})")
+    return Success(i)
+
+
+def func_c(i: int) -> Result[int, str]:
+    if i == 3:
+        return Failure(f"func_c({i})")
+    return Success(i)
+
+
+def func_d(i: int) -> Result[str, str]:
+    return Success(f"func_d({i})")
+
+
+def chained(i: int) -> Result[str, str]:
+    # fmt: off
+    return (
+        func_a(i)
+        .bind(func_b)
+        .bind(func_c)
+        .bind(func_d)
+    )
+
+
+fused = compose(func_a, func_b, func_c, func_d)
+
+
+# The same stages, returning plain answers:
+def bare_a(i: int) -> int | Failure:
+    if i == 1:
+        return Failure(f"func_a({i})")
+    return i
+
+
+def bare_b(i: int) -> int | Failure:
+    if i == 2:
+        return Failure(f"func_b({i})")
+    return i
+
+
+def bare_c(i: int) -> int | Failure:
+    if i == 3:
+        return Failure(f"func_c({i})")
+    return i
+
+
+def bare_d(i: int) -> str:
+    return f"func_d({i})"
+
+
+fused_bare = compose(*map(Bare, [bare_a, bare_b, bare_c, bare_d]))
+
+
+def per_call_ns(func, i: int) -> float:
+    best = min(
+        timeit.repeat(lambda: func(i), number=N, repeat=5)
+    )
+    return best / N * 1e9
+
+
+if __name__ == "__main__":
+    expected = [chained(i) for i in range(5)]
+    assert expected == [fused(i) for i in range(5)]
+    assert expected == [fused_bare(i) for i in range(5)]
+    print(
+        f"{'input':<8}{'chained ns':>12}{'compose ns':>12}"
+        f"{'Bare ns':>10}"
+    )
+    for i in [4, 1, 2, 3]:  # Success, then fail at a, b, c
+        print(
+            f"{i:<8}{per_call_ns(chained, i):>12.1f}"
+            f"{per_call_ns(fused, i):>12.1f}"
+            f"{per_call_ns(fused_bare, i):>10.1f}"
+        )
@@ -0,0 +1,40 @@
+#: bench_parallel.py
+# Throughput of parallel_map as worker count grows
+# python bench_parallel.py
+import os
+import time
+
+from parallel import parallel_map
+from result_lib import Failure, Result, Success
+
+N = 200_000
+
+
+def composed(i: int) -> Result[int, ZeroDivisionError]:
+    "CPU-bound enough that the pool can pay for itself"
+    total = sum(k * k for k in range(i % 200))
+    if i % 7 == 3:
+        return Failure(ZeroDivisionError(f"composed({i})"))
+    return Success(total)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    expected = [composed(i) for i in range(N)]
+    serial = time.perf_counter() - start
+    print(f"{'workers':<10}{'items/s':>12}{'speedup':>10}")
+    print(f"{'serial':<10}{N / serial:>12,.0f}{1:>10.2f}")
+    cores = os.cpu_count() or 1
+    workers = 1
+    while workers <= cores:
+        start = time.perf_counter()
+        results = parallel_map(composed, range(N), workers)
+        elapsed = time.perf_counter() - start
+        assert [r.success for r in results] == [
+            r.success for r in expected
+        ]
+        print(
+            f"{workers:<10}{N / elapsed:>12,.0f}"
+            f"{serial / elapsed:>10.2f}"
+        )
+        workers *= 2
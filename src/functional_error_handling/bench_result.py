@@ -0,0 +1,93 @@
+#: bench_result.py
+# Slotted Success/Failure vs dataclasses vs returns.result
+# python bench_result.py
+import sys
+import timeit
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+
+import result_with_bind
+
+ANSWER = TypeVar("ANSWER")
+ERROR = TypeVar("ERROR")
+N = 200_000
+
+
+# The original frozen-dataclass representation:
+@dataclass(frozen=True)
+class Result(Generic[ANSWER, ERROR]):
+    def bind(
+        self, func: Callable[[ANSWER], "Result"]
+    ) -> "Result[ANSWER, ERROR]":
+        if isinstance(self, Success):
+            return func(self.unwrap())
+        return self
+
+
+@dataclass(frozen=True)
+class Success(Result[ANSWER, ERROR]):
+    answer: ANSWER
+
+    def unwrap(self) -> ANSWER:
+        return self.answer
+
+
+@dataclass(frozen=True)
+class Failure(Result[ANSWER, ERROR]):
+    error: ERROR
+
+
+def instance_size(obj: object) -> int:
+    "Bytes for the object plus its __dict__, if any"
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def per_op_ns(stmt: Callable[[], object]) -> float:
+    best = min(timeit.repeat(stmt, number=N, repeat=5))
+    return best / N * 1e9
+
+
+def measure(name: str, success: type, failure: type):
+    def stage(i):
+        return success(i)
+
+    ok = success(1)
+    bad = failure("error")
+    construct = per_op_ns(lambda: success(1))
+    bind_ok = per_op_ns(
+        lambda: ok.bind(stage).bind(stage).bind(stage)
+    )
+    bind_bad = per_op_ns(
+        lambda: bad.bind(stage).bind(stage).bind(stage)
+    )
+    size = instance_size(ok)
+    print(
+        f"{name:<18}{construct:>10.1f}{bind_ok:>12.1f}"
+        f"{bind_bad:>12.1f}{size:>8}"
+    )
+
+
+if __name__ == "__main__":
+    print(
+        f"{'':<18}{'new ns':>10}{'3x bind ns':>12}"
+        f"{'3x skip ns':>12}{'bytes':>8}"
+    )
+    measure("dataclass", Success, Failure)
+    measure(
+        "slotted",
+        result_with_bind.Success,
+        result_with_bind.Failure,
+    )
+    try:
+        from returns import result as returns_result
+    except ImportError:
+        print("returns.result not installed")
+    else:
+        measure(
+            "returns.result",
+            returns_result.Success,
+            returns_result.Failure,
+        )
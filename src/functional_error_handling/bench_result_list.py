@@ -0,0 +1,41 @@
+#: bench_result_list.py
+# Memory for N results: list of (i, Result) tuples vs ResultList
+# python bench_result_list.py
+import gc
+import tracemalloc
+
+from result_lib import Failure, Result, Success
+from result_list import ResultList
+
+N = 1_000_000
+
+
+def func_a(i: int) -> Result[int, str]:
+    if i % 100 == 1:  # One failure in a hundred
+        return Failure(f"func_a({i})")
+    return Success(i)
+
+
+def allocated(build) -> int:
+    "Bytes still held by the value build() returns"
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size
+
+
+if __name__ == "__main__":
+    inputs = range(N)
+    rows = [
+        ("list of tuples", lambda: [(i, func_a(i)) for i in inputs]),
+        ("list of Results", lambda: [func_a(i) for i in inputs]),
+        ("ResultList", lambda: ResultList(map(func_a, inputs))),
+        ("ResultList('q')", lambda: ResultList(map(func_a, inputs), "q")),
+    ]
+    for name, build in rows:
+        size = allocated(build)
+        print(f"{name:<18}{size / 1e6:>7.1f} MB", end="")
+        print(f"{size / N:>7.1f} B/item")
@@ -0,0 +1,48 @@
+#: bench_safe.py
+# safe / safe_map vs returns.safe vs bare try/except
+# python bench_safe.py
+import timeit
+
+from result_lib import Failure, Success, safe, safe_map
+
+N = 100_000
+
+
+def func_d(i: int) -> str:
+    1 / (i % 10)  # Fails for one input in ten
+    return f"func_d({i})"
+
+
+def bare_try(inputs):
+    results = []
+    for i in inputs:
+        try:
+            results.append(Success(func_d(i)))
+        except Exception as e:
+            results.append(Failure(e))
+    return results
+
+
+def per_item_ns(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=5)) / N * 1e9
+
+
+if __name__ == "__main__":
+    inputs = range(N)
+    local_safe = safe(func_d)
+    rows = [
+        ("bare try/except", lambda: bare_try(inputs)),
+        ("safe", lambda: [local_safe(i) for i in inputs]),
+        ("safe_map", lambda: safe_map(func_d, inputs)),
+    ]
+    try:
+        from returns.result import safe as returns_safe
+    except ImportError:
+        print("returns not installed")
+    else:
+        r_safe = returns_safe(func_d)
+        rows.append(
+            ("returns.safe", lambda: [r_safe(i) for i in inputs])
+        )
+    for name, func in rows:
+        print(f"{name:<18}{per_item_ns(func):>10.1f} ns/item")
@@ -0,0 +1,59 @@
+#: bench_sequence.py
+# sequence / traverse on a million Results vs a hand-written loop
+# python bench_sequence.py
+import time
+
+from result_lib import (
+    Failure,
+    Result,
+    Success,
+    sequence,
+    traverse,
+)
+
+N = 1_000_000
+
+
+def by_hand(results: list) -> Result:
+    answers = []
+    for r in results:
+        if isinstance(r, Failure):
+            return r
+        answers.append(r.unwrap())
+    return Success(answers)
+
+
+def stage(i: int) -> Result[int, str]:
+    if i == fail_at:
+        return Failure(f"stage({i})")
+    return Success(i)
+
+
+def seconds(func) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    inputs = range(N)
+    print(
+        f"{'failure at':<12}{'by hand':>10}{'sequence':>10}"
+        f"{'accumulate':>12}{'traverse':>10}  (seconds)"
+    )
+    for fail_at in [-1, N - 1, N // 2, 0]:  # -1: never fails
+        results = [stage(i) for i in inputs]
+        hand = seconds(lambda: by_hand(results))
+        seq = seconds(lambda: sequence(results))
+        acc = seconds(
+            lambda: sequence(results, accumulate=True)
+        )
+        trav = seconds(lambda: traverse(stage, inputs))
+        label = "none" if fail_at < 0 else str(fail_at)
+        print(
+            f"{label:<12}{hand:>10.3f}{seq:>10.3f}"
+            f"{acc:>12.3f}{trav:>10.3f}"
+        )
@@ -0,0 +1,81 @@
+#: bench_startup.py
+# Import time of each example in a fresh interpreter, from
+# python -X importtime. Exits with status 1 over --budget.
+# python bench_startup.py [--budget MS] [--runs N]
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+script_dir = Path(__file__).parent
+scripts = ["example3", "example4", "example5", "example6"]
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    For module and everything it imported, in one fresh run:
+    name -> (self, cumulative) microseconds.
+    """
+    run = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=script_dir,
+        stdout=subprocess.DEVNULL,  # Examples print
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    times = {}
+    # Children are reported before, and indented under, parents:
+    for line in reversed(run.stderr.splitlines()):
+        own, total, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            times[module] = (int(own), int(total))
+        elif times:
+            if not name.startswith("  "):
+                break  # Imported before module, e.g. by site
+            times[name.strip()] = (int(own), int(total))
+    return times
+
+
+def cold_start(module: str, runs: int) -> Tuple[float, List[str]]:
+    "Best cumulative ms of module, and its slowest imports"
+    import_times(module)  # Warm the OS file cache
+    best = min(
+        (import_times(module) for _ in range(runs)),
+        key=lambda times: times[module][1],
+    )
+    slowest = sorted(
+        (name for name in best if name != module),
+        key=lambda name: -best[name][0],
+    )[:3]
+    return best[module][1] / 1000, [
+        f"{name} {best[name][0] / 1000:.1f}" for name in slowest
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=15.0,
+        help="Milliseconds allowed to import each example",
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    over = []
+    print(f"{'module':<16}{'ms':>8}  slowest imports (self ms)")
+    for module in scripts:
+        ms, slowest = cold_start(module, args.runs)
+        print(f"{module:<16}{ms:>8.1f}  {', '.join(slowest)}")
+        if ms > args.budget:
+            over.append(module)
+    try:
+        ms, _ = cold_start("returns.result", args.runs)
+        print(f"{'returns.result':<16}{ms:>8.1f}  (for comparison)")
+    except subprocess.CalledProcessError:
+        pass  # returns not installed
+    if over:
+        print(f"Over {args.budget} ms budget: {', '.join(over)}")
+        sys.exit(1)
@@ -0,0 +1,279 @@
+#: bench_strategies.py
+# Cost of each error-handling strategy in the examples,
+# swept over failure rate and pipeline depth.
+# python bench_strategies.py                  # Compare to baseline
+# python bench_strategies.py --save-baseline  # Record new baseline
+# Times are relative to `union` measured in the same run, so the
+# baseline holds no machine-specific absolute timings. Memory is
+# counted by tracemalloc, which doesn't vary between runs.
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from statistics import median
+from typing import Callable, Dict, List, Tuple
+
+import result_lib as local
+
+N = 10_000
+REPEATS = 9  # Interleaved across strategies
+REFERENCE = "union"  # Plain code: times are relative to this
+DEPTHS = [1, 3, 5]
+RATES = [0.0, 0.1, 0.5, 1.0]
+baseline_path = Path(__file__).with_name("bench_baseline.json")
+
+
+def make_workload(depth: int, rate: float) -> Dict[str, Callable]:
+    """
+    One pipeline per strategy. Input i fails at stage i % depth
+    when it is in the failing sample.
+    """
+    rng = random.Random(depth * 1000 + int(rate * 100))
+    fails = set(rng.sample(range(N), int(N * rate)))
+
+    def failing(k: int, i: int) -> bool:
+        return i in fails and i % depth == k
+
+    def raising(k: int) -> Callable:  # example1
+        def stage(i: int) -> int:
+            if failing(k, i):
+                raise ValueError(f"stage{k}({i})")
+            return i
+
+        return stage
+
+    def union(k: int) -> Callable:  # example2
+        def stage(i: int) -> int | str:
+            if failing(k, i):
+                return f"stage{k}({i})"
+            return i
+
+        return stage
+
+    def result(module, k: int) -> Callable:  # example3+
+        def stage(i: int):
+            if failing(k, i):
+                return module.Failure(f"stage{k}({i})")
+            return module.Success(i)
+
+        return stage
+
+    stages_raise = [raising(k) for k in range(depth)]
+    stages_union = [union(k) for k in range(depth)]
+    stages_local = [result(local, k) for k in range(depth)]
+
+    def exceptions(i: int):
+        try:
+            for stage in stages_raise:
+                i = stage(i)
+            return i
+        except ValueError as e:
+            return e
+
+    def unions(i: int):
+        for stage in stages_union:
+            i = stage(i)
+            if isinstance(i, str):
+                return i
+        return i
+
+    def manual(stages: List[Callable], failure: type):
+        def pipeline(i: int):
+            r = stages[0](i)
+            for stage in stages[1:]:
+                if isinstance(r, failure):
+                    return r
+                r = stage(r.unwrap())
+            return r
+
+        return pipeline
+
+    def bind(i: int):
+        r = stages_local[0](i)
+        for stage in stages_local[1:]:
+            r = r.bind(stage)
+        return r
+
+    workload = {
+        "exceptions": exceptions,
+        "union": unions,
+        "local isinstance": manual(stages_local, local.Failure),
+        "local bind": bind,
+        "local compose": local.compose(*stages_local),
+    }
+    try:
+        import returns.result as returns_result
+    except ImportError:
+        return workload
+
+    stages_returns = [
+        result(returns_result, k) for k in range(depth)
+    ]
+
+    def returns_bind(i: int):
+        r = stages_returns[0](i)
+        for stage in stages_returns[1:]:
+            r = r.bind(stage)
+        return r
+
+    def chain(k: int, i: int):  # Generator for Result.do
+        for answer in stages_returns[k](i):
+            if k == depth - 1:
+                yield answer
+            else:
+                yield from chain(k + 1, answer)
+
+    def returns_do(i: int):
+        return returns_result.Result.do(chain(0, i))
+
+    workload.update(
+        {
+            "returns isinstance": manual(
+                stages_returns, returns_result.Failure
+            ),
+            "returns bind": returns_bind,
+            "returns do": returns_do,
+        }
+    )
+    return workload
+
+
+def time_strategies(
+    workload: Dict[str, Callable],
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Best seconds per strategy, and the median of its time over
+    REFERENCE's within each repeat. Repeats are interleaved so
+    that drift in machine speed affects every strategy alike;
+    the garbage collector is off, as in timeit.
+    """
+    inputs = range(N)
+    best = dict.fromkeys(workload, float("inf"))
+    ratios: Dict[str, List[float]] = {n: [] for n in workload}
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(REPEATS):
+            elapsed = {}
+            for name, pipeline in workload.items():
+                start = time.perf_counter()
+                [pipeline(i) for i in inputs]
+                elapsed[name] = time.perf_counter() - start
+                best[name] = min(best[name], elapsed[name])
+            reference = elapsed[REFERENCE]
+            for name in workload:
+                ratios[name].append(elapsed[name] / reference)
+    finally:
+        gc.enable()
+    return best, {name: median(r) for name, r in ratios.items()}
+
+
+def memory(pipeline: Callable) -> Dict[str, float]:
+    """
+    Blocks still allocated per op while every result is kept,
+    counted by tracemalloc so the number is the same each run.
+    """
+    inputs = range(N)
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.reset_peak()
+    kept = [pipeline(i) for i in inputs]
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.stop()
+    del kept
+    retained = sum(
+        stat.count_diff
+        for stat in after.compare_to(before, "filename")
+    )
+    return {
+        "blocks_per_op": round(retained / N, 2),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def gated(name: str) -> bool:
+    "Only this project's code can regress; returns is shown only"
+    return not name.startswith("returns")
+
+
+def main(save_baseline: bool, tolerance: float) -> int:
+    baseline = (
+        json.loads(baseline_path.read_text())
+        if baseline_path.exists()
+        else {}
+    )
+    measurements: Dict[str, Dict[str, float]] = {}
+    regressions = []
+    print(
+        f"{'strategy':<20}{'depth':>6}{'fail %':>8}{'ns/op':>10}"
+        f"{'x ' + REFERENCE:>9}{'blocks/op':>11}{'peak KiB':>10}"
+    )
+    for depth in DEPTHS:
+        for rate in RATES:
+            workload = make_workload(depth, rate)
+            times, relatives = time_strategies(workload)
+            for name, pipeline in workload.items():
+                key = f"{name}/{depth}/{rate}"
+                relative = relatives[name]
+                m = memory(pipeline)
+                measurements[key] = {
+                    "relative": round(relative, 2),
+                    "blocks_per_op": m["blocks_per_op"],
+                }
+                flag = ""
+                old = baseline.get(key, {})
+                if "relative" in old and gated(name) and (
+                    relative > old["relative"] * tolerance
+                    or m["blocks_per_op"]
+                    > old["blocks_per_op"] + 0.5
+                ):
+                    regressions.append(key)
+                    flag = "  REGRESSION"
+                print(
+                    f"{name:<20}{depth:>6}{rate:>8.0%}"
+                    f"{times[name] / N * 1e9:>10.1f}"
+                    f"{relative:>9.2f}"
+                    f"{m['blocks_per_op']:>11.2f}"
+                    f"{m['peak_kib']:>10.1f}{flag}"
+                )
+    if save_baseline:
+        baseline_path.write_text(
+            json.dumps(measurements, indent=2) + "\n"
+        )
+        print(f"Saved {baseline_path.name}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regressions:")
+        for key in regressions:
+            print(f"\t{key}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark error-handling strategies"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store these results as the new baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help=(
+            f"Fail if time relative to {REFERENCE} exceeds"
+            " the baseline's by this factor"
+        ),
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.save_baseline, args.tolerance))
@@ -0,0 +1,270 @@
+#: bind_metrics.py
+# Opt-in per-stage metrics for Result.bind: calls, latency,
+# short-circuits and error types.
+import inspect
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+
+from result_lib import LazyFailure, Result
+
+_result_library = True  # Frames skipped by failure_origin
+
+BUCKETS = 64  # Bucket k: latency below 2**k nanoseconds
+
+_plain_bind = Result.bind  # Restored by disable()
+
+
+class StageStats:
+    "Counters for one stage, owned by one thread"
+
+    __slots__ = (
+        "stage",
+        "calls",
+        "failures",
+        "skipped",
+        "errors",
+        "latency",
+    )
+
+    def __init__(self, stage: Callable) -> None:
+        self.stage = stage  # Also keeps the id in its key valid
+        self.calls = 0  # func was called
+        self.failures = 0  # func returned a Failure
+        self.skipped = 0  # Bypassed by an earlier Failure
+        self.errors: Dict[str, int] = {}  # Error type -> count
+        self.latency = [0] * BUCKETS
+
+    def add(self, other: "StageStats") -> None:
+        self.calls += other.calls
+        self.failures += other.failures
+        self.skipped += other.skipped
+        for name, count in other.errors.items():
+            self.errors[name] = self.errors.get(name, 0) + count
+        for bucket, count in enumerate(other.latency):
+            self.latency[bucket] += count
+
+
+class _Owner:
+    "Kept in a thread's local storage, so it dies with the thread"
+
+    __slots__ = ("__weakref__",)
+
+
+class _Threads:
+    """
+    Every live thread's counters, so snapshot() can merge them.
+    A thread's counters are folded into `ended` when it exits,
+    so short-lived threads don't accumulate.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.live: Dict[int, Dict[Any, StageStats]] = {}
+        self.ended: Dict[Any, StageStats] = {}
+
+    def register(self, stages: Dict[Any, StageStats]) -> _Owner:
+        owner = _Owner()
+        with self.lock:
+            self.live[id(stages)] = stages
+        weakref.finalize(owner, self.retire, stages)
+        return owner
+
+    def retire(self, stages: Dict[Any, StageStats]) -> None:
+        with self.lock:
+            del self.live[id(stages)]
+            for key, stats in stages.items():
+                if key in self.ended:
+                    self.ended[key].add(stats)
+                else:
+                    self.ended[key] = stats
+
+
+_local = threading.local()
+_threads = _Threads()
+
+
+def _stage(func: Callable) -> Callable:
+    "The function itself, inside a partial, Bare or @wraps wrapper"
+    return inspect.unwrap(getattr(func, "func", func))
+
+
+def _stats_for(func: Callable) -> StageStats:
+    try:
+        stages = _local.stages
+    except AttributeError:
+        stages = _local.stages = {}
+        _local.owner = _threads.register(stages)
+    # By code, so a lambda or closure made per call shares one
+    # entry. Unwrapped first: each @safe or @memoize stage has
+    # its own code, though their wrappers share one. By id, as
+    # code objects with the same contents compare equal.
+    stage = _stage(func)
+    key = id(getattr(stage, "__code__", stage))
+    stats = stages.get(key)
+    if stats is None:
+        stats = stages[key] = StageStats(stage)
+    return stats
+
+
+def _error_type(failure: Any) -> str:
+    if isinstance(failure, LazyFailure) and failure.factory:
+        # Don't build the error just to count it:
+        return getattr(failure.factory, "__name__", "?")
+    return type(failure.error).__name__
+
+
+def _measured_bind(
+    self: Result, func: Callable[[Any], Result]
+) -> Result:
+    stats = _stats_for(func)
+    if not self.success:
+        stats.skipped += 1
+        return self
+    start = time.perf_counter_ns()
+    result = func(self.answer)  # type: ignore
+    elapsed = time.perf_counter_ns() - start
+    stats.calls += 1
+    stats.latency[min(elapsed.bit_length(), BUCKETS - 1)] += 1
+    if not result.success:
+        stats.failures += 1
+        name = _error_type(result)
+        stats.errors[name] = stats.errors.get(name, 0) + 1
+    return result
+
+
+def enable() -> None:
+    "Swap in the measuring bind; the plain one has no checks"
+    Result.bind = _measured_bind  # type: ignore[method-assign]
+
+
+def disable() -> None:
+    Result.bind = _plain_bind  # type: ignore[method-assign]
+
+
+def reset() -> None:
+    global _local, _threads
+    _local, _threads = threading.local(), _Threads()
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    "Measure binds within the block, on every thread"
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Totals across threads, by stage name. latency_ns maps each
+    bucket's upper bound (ns) to its count; empty buckets
+    are left out.
+    """
+    totals: Dict[str, Dict[str, Any]] = {}
+    with _threads.lock:
+        every = [_threads.ended, *_threads.live.values()]
+        for stages in every:
+            for stats in list(stages.values()):
+                stage = stats.stage
+                total = totals.setdefault(
+                    getattr(stage, "__qualname__", repr(stage)),
+                    {
+                        "calls": 0,
+                        "failures": 0,
+                        "skipped": 0,
+                        "errors": {},
+                        "latency_ns": {},
+                    },
+                )
+                total["calls"] += stats.calls
+                total["failures"] += stats.failures
+                total["skipped"] += stats.skipped
+                errors = total["errors"]
+                for name, count in stats.errors.items():
+                    errors[name] = errors.get(name, 0) + count
+                latency = total["latency_ns"]
+                for bucket, count in enumerate(stats.latency):
+                    if count:
+                        bound = 1 << bucket
+                        latency[bound] = (
+                            latency.get(bound, 0) + count
+                        )
+    return totals
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    from memoize import memoize
+    from result_lib import Failure, Success, safe
+    from validate_output import console
+
+    def func_a(i: int) -> Result[int, str]:
+        if i == 1:
+            return Failure(f"func_a({i})")
+        return Success(i)
+
+    def func_b(i: int) -> Result[int, ValueError]:
+        if i == 2:
+            return Failure(ValueError(f"func_b({i})"))
+        return Success(i)
+
+    def func_c(i: int) -> Result[float, ZeroDivisionError]:
+        if i == 0:
+            return Failure.lazy(ZeroDivisionError, "func_c")
+        return Success(1 / i)
+
+    @safe
+    def func_d(i: float) -> float:
+        return 1 / (i - 0.25)  # Fails for 1 / 4
+
+    @safe
+    def func_e(i: float) -> float:
+        return i * 2
+
+    @memoize()
+    def func_f(i: float) -> Result[float, str]:
+        return Success(i)
+
+    def composed(i: int) -> Result:
+        # fmt: off
+        return (
+            Success(i)
+            .bind(func_a)
+            .bind(func_b)
+            .bind(func_c)
+            .bind(func_d)
+            .bind(func_e)
+            .bind(func_f)
+        )
+
+    composed(0)
+    print(snapshot())  # Disabled: nothing recorded
+    with instrumented():
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(composed, range(5)))
+        for i in range(1000):
+            Success(i).bind(lambda n: Success(n))
+    composed(0)
+    print(len(_threads.live))  # Pool threads ended, merged
+    print(len(_local.stages))  # 1000 lambdas, one entry
+    for stage, stats in snapshot().items():
+        histogram = stats.pop("latency_ns")
+        print(stage, stats, sum(histogram.values()))
+    console == """
+{}
+1
+1
+func_a {'calls': 5, 'failures': 1, 'skipped': 0, 'errors': {'str': 1}} 5
+func_b {'calls': 4, 'failures': 1, 'skipped': 1, 'errors': {'ValueError': 1}} 4
+func_c {'calls': 3, 'failures': 1, 'skipped': 2, 'errors': {'ZeroDivisionError': 1}} 3
+func_d {'calls': 2, 'failures': 1, 'skipped': 3, 'errors': {'ZeroDivisionError': 1}} 2
+func_e {'calls': 1, 'failures': 0, 'skipped': 4, 'errors': {}} 1
+func_f {'calls': 1, 'failures': 0, 'skipped': 4, 'errors': {}} 1
+<lambda> {'calls': 1000, 'failures': 0, 'skipped': 0, 'errors': {}} 1000
+"""
@@ -2,7 +2,7 @@
 # Result type returns Success/Failure
 from pprint import pprint
 
-from returns.result import Failure, Result, Success
+from result_lib import Failure, Result, Success
 from validate_output import console
 
 
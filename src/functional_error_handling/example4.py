@@ -1,10 +1,10 @@
 #: example4.py
 # Composing functions
-# Using https://github.com/dry-python/returns
+# API as in https://github.com/dry-python/returns
 from pprint import pprint
 
 from example3 import func_a
-from returns.result import Failure, Result, Success, safe
+from result_lib import Failure, Result, Success, safe
 from validate_output import console
 
 
@@ -3,7 +3,7 @@
 from pprint import pprint
 
 from example4 import func_a, func_b, func_c, func_d
-from returns.result import Result
+from result_lib import Result
 from validate_output import console
 
 
@@ -0,0 +1,179 @@
+#: failure_origin.py
+# Record where a sample of Failures were created: the code
+# object and line, turned into names and source only on demand.
+import linecache
+import random
+import sys
+from types import CodeType, FrameType
+from typing import Any, Callable
+
+from result_lib import (
+    Failure,
+    LazyFailure,
+    _set_origin,
+)
+
+_plain_inits = (Failure.__init__, LazyFailure.__init__)
+
+
+class Origin:
+    "Cheap to capture; holds no frame, so keeps nothing alive"
+
+    __slots__ = ("code", "lineno")
+
+    def __init__(self, code: CodeType, lineno: int):
+        self.code = code
+        self.lineno = lineno
+
+    @property
+    def filename(self) -> str:
+        return self.code.co_filename
+
+    @property
+    def function(self) -> str:
+        return self.code.co_qualname
+
+    @property
+    def source(self) -> str:
+        "The line of code, read only when asked for"
+        line = linecache.getline(self.filename, self.lineno)
+        return line.strip()
+
+    def __repr__(self) -> str:
+        return (
+            f'File "{self.filename}", line {self.lineno},'
+            f" in {self.function}"
+        )
+
+
+def _in_library(frame: FrameType) -> bool:
+    """
+    Frames of the project's Result modules (Failure.lazy, @safe,
+    traverse, ResultList, parallel_map...), which mark themselves
+    with _result_library, are skipped to find the stage that
+    made the Failure. Not when run as a script, for its demo.
+    """
+    globals_ = frame.f_globals
+    return (
+        globals_.get("_result_library", False)
+        and globals_.get("__name__") != "__main__"
+    )
+
+
+def _raised_in(error: BaseException) -> Origin | None:
+    "First frame outside the library in error's traceback"
+    tb = error.__traceback__
+    while tb is not None:
+        if not _in_library(tb.tb_frame):
+            return Origin(tb.tb_frame.f_code, tb.tb_lineno)
+        tb = tb.tb_next
+    return None
+
+
+def _capture(failure: Failure, depth: int) -> None:
+    frame: FrameType = sys._getframe(depth + 1)
+    origin = None
+    if _in_library(frame):
+        # An exception caught by the library, e.g. in @safe,
+        # came from the stage that raised it:
+        if not isinstance(failure, LazyFailure):
+            error = failure.error
+            if isinstance(error, BaseException):
+                origin = _raised_in(error)
+        while _in_library(frame) and frame.f_back is not None:
+            frame = frame.f_back
+    if origin is None:
+        origin = Origin(frame.f_code, frame.f_lineno)
+    _set_origin(failure, origin)
+
+
+def _sampled(init: Callable, rate: float) -> Callable:
+    if rate >= 1.0:
+
+        def always(self: Any, *args: Any) -> None:
+            init(self, *args)
+            _capture(self, 1)
+
+        return always
+    chance = random.random
+
+    def sometimes(self: Any, *args: Any) -> None:
+        init(self, *args)
+        if chance() < rate:
+            _capture(self, 1)
+
+    return sometimes
+
+
+def set_sampling(rate: float) -> None:
+    """
+    Record the origin of about `rate` (0.0 to 1.0) of new
+    Failures. At 0.0 (the default) the original __init__
+    methods are restored, so there is no cost at all.
+    """
+    for cls, init in zip((Failure, LazyFailure), _plain_inits):
+        if rate <= 0.0:
+            cls.__init__ = init  # type: ignore[method-assign]
+        else:
+            cls.__init__ = _sampled(init, rate)  # type: ignore
+
+
+if __name__ == "__main__":
+    from pathlib import Path
+
+    from result_lib import Result, Success
+    from validate_output import console
+
+    def func_c(i: int) -> Result[int, str]:
+        if i == 3:
+            return Failure(f"func_c({i})")
+        return Success(i)
+
+    def func_d(i: int) -> Result[float, ZeroDivisionError]:
+        if i == 0:
+            return Failure.lazy(ZeroDivisionError, "func_d")
+        return Success(1 / i)
+
+    print(func_c(3).origin)  # Sampling is off by default
+    set_sampling(1.0)
+    origin = func_c(3).origin
+    first_line = func_c.__code__.co_firstlineno
+    print(Path(origin.filename).name, origin.lineno - first_line)
+    print(origin.function, "|", origin.source)
+    lazy = func_d(0)
+    print(lazy.origin.function, "|", lazy.origin.source)
+    print(lazy.factory is ZeroDivisionError)  # Still unbuilt
+    from example4 import func_d as safe_func_d  # @safe
+
+    raised = safe_func_d(0).origin
+    print(raised.function, "|", raised.source)
+    from result_tools import sequence
+
+    results = [func_c(3), func_c(3)]
+    collected = sequence(results, accumulate=True).origin
+    print(collected.function, "|", collected.source)
+    from result_batch import ResultBatch
+    from result_list import ResultList
+
+    stored = ResultList([Failure("x")])[0].origin  # Rebuilt
+    print(stored.function, "|", stored.source)
+    batched = ResultBatch.from_results([Failure("x")])
+    print(batched[0].origin.source)
+    set_sampling(0.5)
+    sampled = [func_c(3).origin for _ in range(1000)]
+    print(400 < sum(o is not None for o in sampled) < 600)
+    set_sampling(0.0)
+    print(func_c(3).origin, func_c(3) == Failure("func_c(3)"))
+    console == """
+None
+failure_origin.py 2
+func_c | return Failure(f"func_c({i})")
+func_d | return Failure.lazy(ZeroDivisionError, "func_d")
+True
+func_d | 1 / i
+<module> | collected = sequence(results, accumulate=True).origin
+<module> | stored = ResultList([Failure("x")])[0].origin  # Rebuilt
+print(batched[0].origin.source)
+True
+None True
+"""
@@ -0,0 +1,106 @@
+#: memoize.py
+# Cache whole Results (Failures too) for pure stages
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+from result_lib import Result
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+def memoize(
+    maxsize: int = 1024, ttl: float | None = None
+) -> Callable[[Callable[..., Result]], Callable[..., Result]]:
+    """
+    Decorator for pure stages. Keeps the `maxsize` most recently
+    used Results; with `ttl`, entries older than `ttl` seconds
+    are recomputed. Arguments must be hashable.
+    """
+
+    def decorator(
+        func: Callable[..., Result],
+    ) -> Callable[..., Result]:
+        cache: OrderedDict[Tuple, Tuple[Result, float]] = (
+            OrderedDict()
+        )
+        stats = {"hits": 0, "misses": 0, "evictions": 0}
+        clock = time.monotonic
+
+        # Guards cache and stats, not the call to func: two
+        # threads may compute the same Result, and one is kept.
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args: Any) -> Result:
+            with lock:
+                entry = cache.get(args)
+                if entry is not None and (
+                    ttl is None or clock() - entry[1] < ttl
+                ):
+                    stats["hits"] += 1
+                    cache.move_to_end(args)
+                    return entry[0]
+                stats["misses"] += 1
+            result = func(*args)
+            with lock:
+                cache[args] = (result, 0.0 if ttl is None else clock())
+                cache.move_to_end(args)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)  # Least recently used
+                    stats["evictions"] += 1
+            return result
+
+        def cache_stats() -> Dict[str, int]:
+            with lock:
+                return {**stats, "size": len(cache)}
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, evictions=0)
+
+        wrapper.cache_stats = cache_stats  # type: ignore
+        wrapper.cache_clear = cache_clear  # type: ignore
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    from result_lib import Failure, Success
+    from validate_output import console
+
+    @memoize(maxsize=2)
+    def func_b(i: int) -> Result[int, ValueError]:
+        print(f"computing func_b({i})")
+        if i == 2:
+            return Failure(ValueError(f"func_b({i})"))
+        return Success(i)
+
+    for i in [2, 2, 1, 2, 3, 1]:
+        func_b(i)
+    print(func_b(2) is func_b(2))
+    print(func_b.cache_stats())  # type: ignore
+    console == """
+computing func_b(2)
+computing func_b(1)
+computing func_b(3)
+computing func_b(1)
+computing func_b(2)
+True
+{'hits': 3, 'misses': 5, 'evictions': 3, 'size': 2}
+"""
+
+    @memoize(ttl=0.0)  # Everything expires immediately
+    def func_a(i: int) -> Result[int, str]:
+        print(f"computing func_a({i})")
+        return Success(i)
+
+    func_a(1), func_a(1)
+    console == """
+computing func_a(1)
+computing func_a(1)
+"""
@@ -0,0 +1,96 @@
+#: parallel.py
+# Fan a composed Result pipeline out to a process pool
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Any, Callable, Iterable, Iterator, List
+
+from result_lib import Failure, Result, Success
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+def _chunks(
+    inputs: Iterable[Any], size: int
+) -> Iterator[List[Any]]:
+    it = iter(inputs)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _run_chunk(
+    composed: Callable[[Any], Any], chunk: List[Any]
+) -> Any:
+    """
+    Runs in the worker. Our own Results travel back as two
+    columns (success flags + payloads) instead of one pickled
+    object per item; anything else is sent back as-is.
+    """
+    results = [composed(arg) for arg in chunk]
+    if all(isinstance(r, Result) for r in results):
+        flags = bytes(r.success for r in results)
+        payloads = [
+            r.answer if r.success else r.error  # type: ignore
+            for r in results
+        ]
+        return flags, payloads
+    return results
+
+
+def _decode(chunk_result: Any) -> List[Any]:
+    if isinstance(chunk_result, tuple):
+        flags, payloads = chunk_result
+        return [
+            Success(p) if ok else Failure(p)
+            for ok, p in zip(flags, payloads)
+        ]
+    return chunk_result
+
+
+def parallel_map(
+    composed: Callable[[Any], Any],
+    inputs: Iterable[Any],
+    workers: int | None = None,
+    chunksize: int = 1000,
+) -> List[Any]:
+    """
+    [composed(i) for i in inputs], spread across `workers`
+    processes (default: one per core), in input order.
+    `composed` must be importable (defined at module level).
+    """
+    if chunksize < 1:
+        raise ValueError(
+            f"chunksize must be at least 1, not {chunksize}"
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError(
+            f"workers must be at least 1, not {workers}"
+        )
+    results: List[Any] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = _chunks(inputs, chunksize)
+        for chunk_result in pool.map(
+            _run_chunk, repeat(composed), chunks
+        ):
+            results.extend(_decode(chunk_result))
+    return results
+
+
+if __name__ == "__main__":
+    from pprint import pprint
+
+    from example5 import composed
+    from validate_output import console
+
+    pprint(
+        parallel_map(composed, range(5), workers=2, chunksize=2)
+    )
+    console == """
+[<Failure: division by zero>,
+ <Failure: func_a(1)>,
+ <Failure: func_b(2)>,
+ <Failure: func_c(3): division by zero>,
+ <Success: func_d(4)>]
+"""
@@ -0,0 +1,226 @@
+#: result_batch.py
+# Columnar Results: one value per row plus a success mask
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from result_lib import (
+    ANSWER,
+    ERROR,
+    Failure,
+    Result,
+    Success,
+)
+
+try:
+    import numpy as np
+except ImportError:  # Fall back to a bytearray mask
+    np = None
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+def _new_mask(size: int) -> Any:
+    if np is not None:
+        return np.ones(size, dtype=bool)
+    return bytearray(b"\x01") * size
+
+
+class ResultBatch(Generic[ANSWER, ERROR]):
+    """
+    Holds many Results as columns: `values` has the answer
+    for successful rows and the error for failed rows. Neither
+    column is changed after creation, so batches share them.
+    """
+
+    __slots__ = ("values", "mask")
+
+    def __init__(self, values: List[Any], mask: Any):
+        self.values = values
+        self.mask = mask  # True/1 where the row succeeded
+
+    @classmethod
+    def of(cls, inputs: Iterable[ANSWER]) -> "ResultBatch":
+        "Start a batch where every row is a Success"
+        values = list(inputs)
+        return cls(values, _new_mask(len(values)))
+
+    @classmethod
+    def from_results(
+        cls, results: Iterable[Result[ANSWER, ERROR]]
+    ) -> "ResultBatch[ANSWER, ERROR]":
+        values = []
+        flags = bytearray()
+        for r in results:
+            if r.success:
+                values.append(r.answer)  # type: ignore
+                flags.append(1)
+            else:
+                values.append(r.error)  # type: ignore
+                flags.append(0)
+        if np is not None:
+            mask = np.frombuffer(flags, dtype=bool).copy()
+            return cls(values, mask)
+        return cls(values, flags)
+
+    def success_indices(self) -> List[int]:
+        if np is not None:
+            return np.flatnonzero(self.mask).tolist()
+        mask = self.mask
+        return [i for i in range(len(mask)) if mask[i]]
+
+    def failure_indices(self) -> List[int]:
+        if np is not None:
+            return np.flatnonzero(~self.mask).tolist()
+        mask = self.mask
+        return [i for i in range(len(mask)) if not mask[i]]
+
+    def bind(
+        self, func: Callable[[ANSWER], Result]
+    ) -> "ResultBatch":
+        """
+        Apply func to the still-successful rows only. Only the
+        columns are batched: func is still called, and still
+        allocates a Result, once per row. See bind_batch().
+        """
+        source = self.values
+        indices = self.success_indices()
+        if len(indices) == len(source):
+            values = [None] * len(source)  # Every row changes
+        else:
+            values = source.copy()  # Keeps the failed rows
+        failed = []
+        for i in indices:
+            r = func(source[i])
+            if r.success:
+                values[i] = r.answer  # type: ignore
+            else:
+                values[i] = r.error  # type: ignore
+                failed.append(i)
+        mask = self.mask  # Shared unless a row failed
+        if failed:
+            mask = mask.copy()
+            if np is not None:
+                mask[failed] = False  # One store for the stage
+            else:
+                for i in failed:
+                    mask[i] = 0
+        return ResultBatch(values, mask)
+
+    def bind_batch(
+        self, func: Callable[[List[ANSWER]], Tuple[List[Any], Any]]
+    ) -> "ResultBatch":
+        """
+        Apply func once, to the answers of every still-successful
+        row. It returns (values, ok): for each of those rows, its
+        new answer, or its error where ok is false. ok can be a
+        list of bools or a NumPy mask. No Result is created.
+        func must not modify the list it is passed.
+        """
+        source = self.values
+        indices = self.success_indices()
+        everything = len(indices) == len(source)
+        answers = source if everything else [source[i] for i in indices]
+        new_values, ok = func(answers)
+        if len(new_values) != len(indices) or len(ok) != len(indices):
+            raise ValueError(
+                f"func must return {len(indices)} values and flags"
+            )
+        if everything:
+            values = list(new_values)
+        else:
+            values = source.copy()  # Keeps the failed rows
+            for i, value in zip(indices, new_values):
+                values[i] = value
+        mask = self.mask  # Shared unless a row failed
+        if np is not None:
+            ok = np.asarray(ok, dtype=bool)
+            if not ok.all():
+                mask = mask.copy()
+                mask[indices] = ok
+        elif not all(ok):
+            mask = mask.copy()
+            for i, flag in zip(indices, ok):
+                mask[i] = 1 if flag else 0
+        return ResultBatch(values, mask)
+
+    def successes(self) -> Tuple[List[int], List[ANSWER]]:
+        "(row indices, answers) of the successful rows"
+        indices = self.success_indices()
+        values = self.values
+        return indices, [values[i] for i in indices]
+
+    def failures(self) -> Tuple[List[int], List[ERROR]]:
+        "(row indices, errors) of the failed rows"
+        indices = self.failure_indices()
+        values = self.values
+        return indices, [values[i] for i in indices]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> Result[ANSWER, ERROR]:
+        if self.mask[i]:
+            return Success(self.values[i])
+        return Failure(self.values[i])
+
+    def __iter__(self) -> Iterator[Result[ANSWER, ERROR]]:
+        for value, ok in zip(self.values, self.mask):
+            yield Success(value) if ok else Failure(value)
+
+
+if __name__ == "__main__":
+    from validate_output import console
+
+    def func_a(i: int) -> Result[int, str]:
+        if i == 1:
+            return Failure(f"func_a({i})")
+        return Success(i)
+
+    def func_b(i: int) -> Result[int, str]:
+        if i == 2:
+            return Failure(f"func_b({i})")
+        return Success(i * 10)
+
+    # fmt: off
+    batch = (
+        ResultBatch.of(range(5))
+        .bind(func_a)
+        .bind(func_b)
+    )
+    print(batch.successes())
+    print(batch.failures())
+    print(list(batch))
+    print(batch.bind(Success).mask is batch.mask)
+    console == """
+([0, 3, 4], [0, 30, 40])
+([1, 2], ['func_a(1)', 'func_b(2)'])
+[<Success: 0>, <Failure: func_a(1)>, <Failure: func_b(2)>, <Success: 30>, <Success: 40>]
+True
+"""
+    print(ResultBatch.from_results(batch).failures())
+    console == """
+([1, 2], ['func_a(1)', 'func_b(2)'])
+"""
+
+    def func_c(answers: List[int]) -> Tuple[List[Any], List[bool]]:
+        "Every row in one call; no Result per row"
+        ok = [answer != 30 for answer in answers]
+        values = [
+            answer + 1 if good else f"func_c({answer})"
+            for answer, good in zip(answers, ok)
+        ]
+        return values, ok
+
+    print(batch.bind_batch(func_c).successes())
+    print(batch.bind_batch(func_c).failures())
+    console == """
+([0, 4], [1, 41])
+([1, 2, 3], ['func_a(1)', 'func_b(2)', 'func_c(30)'])
+"""
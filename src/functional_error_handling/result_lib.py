@@ -0,0 +1,258 @@
+#: result_lib.py
+# The project's Result library: result_with_bind.py plus the
+# parts of returns.result the examples use, with no
+# dependencies, and extras for the other modules.
+from functools import wraps
+from threading import RLock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterator,
+)
+
+import result_with_bind
+from result_with_bind import (  # Re-exported
+    ANSWER,
+    ERROR,
+    UnwrapFailedError,
+    _set_answer,
+    _set_error,
+)
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+class Result(result_with_bind.Result[ANSWER, ERROR]):
+    __slots__ = ()
+
+    if TYPE_CHECKING:  # Inherited; returns this module's Result
+
+        def bind(  # type: ignore[override]
+            self, func: Callable[[ANSWER], "Result"]
+        ) -> "Result[ANSWER, ERROR]": ...
+
+    @staticmethod
+    def combine(
+        func: Callable[..., Any], *results: "Result"
+    ) -> "Result":
+        """
+        Success(func(*answers)), or the first Failure among
+        results. A generator-free alternative to Result.do.
+        """
+        for result in results:
+            if not result.success:
+                return result
+        answers = [r.answer for r in results]  # type: ignore
+        return Success(func(*answers))
+
+    @staticmethod
+    def do(expr: Generator[ANSWER, None, None]) -> "Result":
+        """
+        Result.do(f(a, b) for a in result_a for b in result_b):
+        Success(f(...)), or the first Failure iterated over.
+        """
+        try:
+            return Success(next(expr))
+        except UnwrapFailedError as e:
+            return e.failure  # type: ignore
+
+    def __iter__(self) -> Iterator[ANSWER]:
+        "Yields the answer; a Failure stops Result.do"
+        yield self.unwrap()
+
+
+class Success(
+    result_with_bind.Success[ANSWER, ERROR], Result[ANSWER, ERROR]
+):
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"<Success: {self.answer}>"  # As in returns
+
+    def __reduce__(self):
+        return Success, (self.answer,)
+
+
+class Failure(
+    result_with_bind.Failure[ANSWER, ERROR], Result[ANSWER, ERROR]
+):
+    __slots__ = ("_origin",)  # Set by failure_origin
+
+    @classmethod
+    def lazy(
+        cls, factory: Callable[..., ERROR], *args: Any
+    ) -> "Failure[ANSWER, ERROR]":
+        "Failure whose error is factory(*args), built on first use"
+        return LazyFailure(factory, *args)
+
+    @property
+    def origin(self) -> Any:
+        "Where this Failure was created, if it was sampled"
+        try:
+            return _get_origin(self)
+        except AttributeError:  # Not sampled
+            return None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Failure):  # LazyFailure too
+            return self.error == other.error
+        return NotImplemented
+
+    __hash__ = result_with_bind.Failure.__hash__
+
+    def __repr__(self) -> str:
+        return f"<Failure: {self.error}>"
+
+    def __reduce__(self):
+        return Failure, (self.error,)
+
+
+# Slot accessors bypass the immutable __setattr__:
+_get_error = result_with_bind.Failure.error.__get__  # type: ignore
+_set_origin = Failure._origin.__set__  # type: ignore
+_get_origin = Failure._origin.__get__  # type: ignore
+
+
+class LazyFailure(Failure[ANSWER, ERROR]):
+    "Create with Failure.lazy(); .error, repr, etc. build the error"
+
+    __slots__ = ("factory", "args")
+    factory: Callable[..., ERROR] | None
+    args: tuple
+
+    def __init__(self, factory: Callable[..., ERROR], *args: Any):
+        _set_factory(self, factory)
+        _set_args(self, args)
+
+    @property
+    def error(self) -> ERROR:  # type: ignore[override]
+        if self.factory is not None:
+            # Built once, even if threads ask at the same time.
+            # Reentrant: a factory may read another lazy error.
+            with _build_lock:
+                factory = self.factory
+                if factory is not None:  # Not built meanwhile
+                    _set_error(self, factory(*self.args))
+                    _set_factory(self, None)  # Release arguments
+                    _set_args(self, ())
+        return _get_error(self)
+
+
+_build_lock = RLock()
+_set_factory = LazyFailure.factory.__set__  # type: ignore
+_set_args = LazyFailure.args.__set__  # type: ignore
+
+
+def safe(
+    func: Callable[..., ANSWER],
+) -> Callable[..., Result[ANSWER, Exception]]:
+    "Decorator: exceptions become Failures, answers Successes"
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Result:
+        try:
+            return Success(func(*args, **kwargs))
+        except Exception as e:
+            return Failure(e)
+
+    return wrapper
+
+
+_in_result_tools = {"safe_map", "sequence", "traverse", "compose"}
+
+
+def __getattr__(name: str) -> Any:
+    "Import result_tools only when one of its helpers is used"
+    if name in _in_result_tools:
+        import result_tools
+
+        return getattr(result_tools, name)
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    )
+
+
+if __name__ == "__main__":
+    from validate_output import console
+
+    def half(i: int) -> Result[int, str]:
+        if i % 2:
+            return Failure(f"half({i})")
+        return Success(i // 2)
+
+    for i in [8, 6]:
+        match Success(i).bind(half).bind(half):
+            case Success(answer):
+                print(f"{answer = }")
+            case Failure(error):
+                print(f"{error = }")
+    console == """
+answer = 2
+error = 'half(3)'
+"""
+
+    print(Success(1) == Success(1), Success(1) == Failure(1))
+    try:
+        Failure("x").unwrap()
+    except UnwrapFailedError as e:
+        print(repr(e.failure))
+    try:
+        Success(1).answer = 2  # type: ignore
+    except AttributeError as e:
+        print(e)
+    console == """
+True False
+<Failure: x>
+Success is immutable
+"""
+
+    lazy: Failure[Any, ValueError] = Failure.lazy(
+        ValueError, "built on demand"
+    )
+    print(lazy.factory is ValueError)  # type: ignore
+    print(lazy)
+    print(lazy.factory)  # type: ignore
+    print(lazy == Failure(lazy.error))
+    console == """
+True
+<Failure: built on demand>
+None
+True
+"""
+
+    def add(first: int, second: int) -> int:
+        return first + second
+
+    print(Result.combine(add, half(4), half(8)))
+    print(Result.combine(add, half(3), half(5)))
+    console == """
+<Success: 6>
+<Failure: half(3)>
+"""
+
+    @safe
+    def reciprocal(i: int) -> float:
+        return 1 / i
+
+    print(reciprocal(4), reciprocal(0))
+    console == """
+<Success: 0.25> <Failure: division by zero>
+"""
+
+    def add_three(first: int, second: int, third: int) -> int:
+        return first + second + third
+
+    for i in [2, 3]:
+        # fmt: off
+        print(Result.do(
+            add_three(first, second, third)
+            for first in half(4)
+            for second in half(i)
+            for third in half(8)
+        ))
+    console == """
+<Success: 7>
+<Failure: half(3)>
+"""
@@ -0,0 +1,176 @@
+#: result_list.py
+# Compact storage for many Results: answers in a list or array,
+# success tags in a bitmap, errors in a sparse dict by index.
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    overload,
+)
+
+from result_lib import (
+    ANSWER,
+    ERROR,
+    Failure,
+    Result,
+    Success,
+)
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+class ResultList(Generic[ANSWER, ERROR]):
+    """
+    Append-only. Success/Failure objects are only created when
+    an element is read. A slice is a view sharing the storage;
+    it counts its failures once, when made, so success_count
+    and failure_count are always O(1).
+    """
+
+    __slots__ = (
+        "values",
+        "tags",
+        "errors",
+        "view",
+        "failures",
+    )
+
+    def __init__(
+        self,
+        results: Iterable[Result[ANSWER, ERROR]] = (),
+        typecode: str | None = None,  # e.g. "q": array of int
+    ):
+        self.values: Any = (
+            array(typecode) if typecode is not None else []
+        )
+        self.tags = bytearray()  # Bit i set: element i succeeded
+        self.errors: Dict[int, ERROR] = {}
+        self.view: range | None = None  # Indices, for slices
+        self.failures = 0  # Only kept for slices
+        for result in results:
+            self.append(result)
+
+    def append(self, result: Result[ANSWER, ERROR]) -> None:
+        assert self.view is None, "Cannot append to a slice"
+        i = len(self.values)
+        # values first: if it rejects the answer (say, a str for
+        # typecode "q"), tags and errors are still untouched.
+        if result.success:
+            self.values.append(result.answer)  # type: ignore
+        else:
+            # Placeholder keeps answers aligned with indices:
+            is_array = isinstance(self.values, array)
+            self.values.append(0 if is_array else None)
+            self.errors[i] = result.error  # type: ignore
+        if i % 8 == 0:
+            self.tags.append(0)
+        if result.success:
+            self.tags[i >> 3] |= 1 << (i & 7)
+
+    def _indices(self) -> range:
+        if self.view is not None:
+            return self.view
+        return range(len(self.values))
+
+    def _index(self, i: int) -> int:
+        "Position in the shared storage"
+        if self.view is not None:
+            return self.view[i]
+        if i < 0:
+            i += len(self.values)
+        if not 0 <= i < len(self.values):
+            raise IndexError("ResultList index out of range")
+        return i
+
+    def _count_failures(self, view: range) -> int:
+        "Once, when slicing, so failure_count stays O(1)"
+        size = len(view)
+        if view.step == 1 and size:
+            # Success bits covering view, as one int:
+            first, last = view.start >> 3, (view.stop - 1) >> 3
+            covering = self.tags[first : last + 1]
+            bits = int.from_bytes(covering, "little")
+            bits = bits >> (view.start & 7) & ((1 << size) - 1)
+            return size - bits.bit_count()
+        if len(self.errors) < size:
+            return sum(1 for i in self.errors if i in view)
+        return sum(1 for i in view if i in self.errors)
+
+    def _result(self, i: int) -> Result[ANSWER, ERROR]:
+        if self.tags[i >> 3] >> (i & 7) & 1:
+            return Success(self.values[i])
+        return Failure(self.errors[i])
+
+    @overload
+    def __getitem__(self, i: int) -> Result[ANSWER, ERROR]: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "ResultList": ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            view = ResultList.__new__(ResultList)
+            view.values = self.values
+            view.tags = self.tags
+            view.errors = self.errors
+            view.view = self._indices()[i]
+            view.failures = self._count_failures(view.view)
+            return view
+        return self._result(self._index(i))
+
+    def __len__(self) -> int:
+        if self.view is not None:
+            return len(self.view)
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Result[ANSWER, ERROR]]:
+        for i in self._indices():
+            yield self._result(i)
+
+    @property
+    def failure_count(self) -> int:
+        if self.view is None:
+            return len(self.errors)
+        return self.failures
+
+    @property
+    def success_count(self) -> int:
+        return len(self) - self.failure_count
+
+    def __repr__(self) -> str:
+        return f"ResultList({list(self)})"
+
+
+if __name__ == "__main__":
+    from validate_output import console
+
+    def func_a(i: int) -> Result[int, str]:
+        if i % 3 == 1:
+            return Failure(f"func_a({i})")
+        return Success(i)
+
+    results = ResultList((func_a(i) for i in range(10)), "q")
+    print(results.success_count, results.failure_count)
+    print(results[1], results[-1])
+    evens = results[::2]
+    print(evens)
+    print(evens.success_count, evens.failure_count, evens[1:3])
+    print(len(results[5:5]), list(results[5:5]))
+    print(results[2:9].failure_count, results[::-3].failure_count)
+    try:
+        results.append(Success("not an int"))
+    except TypeError:
+        results.append(Failure("func_a(10)"))
+    print(len(results), results[-1], results.failure_count)
+    console == """
+7 3
+<Failure: func_a(1)> <Success: 9>
+ResultList([<Success: 0>, <Success: 2>, <Failure: func_a(4)>, <Success: 6>, <Success: 8>])
+4 1 ResultList([<Success: 2>, <Failure: func_a(4)>])
+0 []
+2 0
+11 <Failure: func_a(10)> 4
+"""
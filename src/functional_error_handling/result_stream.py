@@ -0,0 +1,129 @@
+#: result_stream.py
+# Lazy stages over (possibly endless) streams of Results
+from collections import deque
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from result_lib import ANSWER, ERROR, Failure, Result
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+def map_bind(
+    func: Callable[[ANSWER], Result],
+    results: Iterable[Result[ANSWER, ERROR]],
+) -> Iterator[Result]:
+    "Lazily bind func to each Result in the stream"
+    for result in results:
+        yield result.bind(func)
+
+
+def partition(
+    results: Iterable[Result[ANSWER, ERROR]],
+) -> Tuple[Iterator[ANSWER], Iterator[ERROR]]:
+    """
+    Split one stream into (answers, errors) streams. Each side
+    pulls from the source on demand; items meant for the other
+    side wait in a queue until that side is read. Reading only
+    one side of an endless stream grows the other side's queue
+    without limit: use split() for constant memory.
+    """
+    source = iter(results)
+    answers: Deque[ANSWER] = deque()
+    errors: Deque[ERROR] = deque()
+
+    def side(mine: deque) -> Iterator:
+        while True:
+            if mine:
+                yield mine.popleft()
+                continue
+            result = next(source, None)
+            if result is None:
+                return
+            if result.success:
+                answers.append(result.answer)  # type: ignore
+            else:
+                errors.append(result.error)  # type: ignore
+
+    return side(answers), side(errors)
+
+
+def split(
+    results: Iterable[Result[ANSWER, ERROR]],
+    on_error: Callable[[ERROR], None],
+) -> Iterator[ANSWER]:
+    """
+    The answers, with each error passed to on_error as it
+    arrives. Nothing is queued, so memory stays constant.
+    """
+    for result in results:
+        if result.success:
+            yield result.answer  # type: ignore
+        else:
+            on_error(result.error)  # type: ignore
+
+
+def take_successes(
+    results: Iterable[Result[ANSWER, ERROR]], n: int
+) -> List[ANSWER]:
+    "The first n answers, reading no further than needed"
+    answers: List[ANSWER] = []
+    if n <= 0:
+        return answers
+    for result in results:
+        if result.success:
+            answers.append(result.answer)  # type: ignore
+            if len(answers) == n:
+                break
+    return answers
+
+
+def first_failure(
+    results: Iterable[Result[ANSWER, ERROR]],
+) -> Failure | None:
+    "Stop at the first Failure; None if the stream has none"
+    for result in results:
+        if not result.success:
+            return result  # type: ignore
+    return None
+
+
+if __name__ == "__main__":
+    from itertools import count, islice
+
+    from result_lib import Success
+    from validate_output import console
+
+    def func_a(i: int) -> Result[int, str]:
+        if i % 4 == 1:
+            return Failure(f"func_a({i})")
+        return Success(i)
+
+    def func_b(i: int) -> Result[int, str]:
+        if i % 3 == 2:
+            return Failure(f"func_b({i})")
+        return Success(i * 10)
+
+    def feed() -> Iterator[Result[int, str]]:
+        return map_bind(func_b, (func_a(i) for i in count()))
+
+    print(take_successes(feed(), 4))
+    print(first_failure(feed()))
+    answers, errors = partition(feed())
+    print(list(islice(errors, 3)))
+    print(list(islice(answers, 3)))
+    seen: List[str] = []
+    print(list(islice(split(feed(), seen.append), 3)), seen)
+    console == """
+[0, 30, 40, 60]
+<Failure: func_a(1)>
+['func_a(1)', 'func_b(2)', 'func_a(5)']
+[0, 30, 40]
+[0, 30, 40] ['func_a(1)', 'func_b(2)']
+"""
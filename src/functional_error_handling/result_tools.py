@@ -0,0 +1,184 @@
+#: result_tools.py
+# Helpers for many Results at once. Loaded on first use
+# through result_lib, so scripts that only need
+# Success/Failure never pay for them.
+from typing import Any, Callable, Iterable, List
+
+from result_lib import (
+    ANSWER,
+    ERROR,
+    Failure,
+    Result,
+    Success,
+)
+
+_result_library = True  # Frames skipped by failure_origin
+
+
+def safe_map(
+    func: Callable[[Any], ANSWER], iterable: Iterable[Any]
+) -> List[Result[ANSWER, Exception]]:
+    "[safe(func)(item) for item in iterable] in a single loop"
+    results: List[Result[ANSWER, Exception]] = []
+    append = results.append
+    for item in iterable:
+        try:
+            append(Success(func(item)))
+        except Exception as e:
+            append(Failure(e))
+    return results
+
+
+def _collect(
+    results: Iterable[Result], size: int | None, accumulate: bool
+) -> Result[List[Any], Any]:
+    "One pass; answers preallocated when size is known"
+    answers: List[Any] = [None] * size if size is not None else []
+    errors: List[Any] = []
+    index = 0
+    for result in results:
+        if result.success:
+            if size is None:
+                answers.append(result.answer)  # type: ignore
+            else:
+                answers[index] = result.answer  # type: ignore
+        elif accumulate:
+            errors.append(result.error)  # type: ignore
+        else:
+            return result  # Stop at the first Failure
+        index += 1
+    if errors:
+        return Failure(errors)
+    return Success(answers)
+
+
+def sequence(
+    results: Iterable[Result[ANSWER, ERROR]],
+    accumulate: bool = False,
+) -> Result[List[ANSWER], Any]:
+    """
+    Success(list of answers), or the first Failure. With
+    accumulate=True, Failure(list of every error) instead.
+    """
+    size = len(results) if hasattr(results, "__len__") else None
+    return _collect(results, size, accumulate)
+
+
+def traverse(
+    func: Callable[[Any], Result[ANSWER, ERROR]],
+    items: Iterable[Any],
+    accumulate: bool = False,
+) -> Result[List[ANSWER], Any]:
+    "sequence(map(func, items)), calling func no more than needed"
+    size = len(items) if hasattr(items, "__len__") else None
+    return _collect(map(func, items), size, accumulate)
+
+
+class Bare:
+    """
+    Wraps a compose() stage that returns its answer as is (no
+    Success), or a Failure. A fused chain of these creates one
+    Success, at the end, instead of one per stage.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[..., Any]):
+        self.func = func
+
+    def __call__(self, *args: Any) -> Any:
+        return self.func(*args)
+
+
+def _arity_one(func: Callable) -> bool:
+    "Takes exactly one positional argument, so no *args needed"
+    code = getattr(func, "__code__", None)
+    return (
+        code is not None
+        and code.co_argcount == 1
+        and not code.co_flags & 0x0C  # *args or **kwargs
+        and not code.co_kwonlyargcount
+        and getattr(func, "__self__", None) is None  # Unbound
+    )
+
+
+def compose(
+    first: Callable[..., Any], *rest: Callable[[Any], Any]
+) -> Callable[..., Result]:
+    """
+    Fuse first(...).bind(rest[0]).bind(rest[1])... into one
+    straight-line function, generated once up front. Stages
+    wrapped in Bare return plain answers, which are passed on
+    without allocating a Success for each.
+    """
+    stages = (first, *rest)
+    bare = [isinstance(stage, Bare) for stage in stages]
+    funcs = [s.func if b else s for s, b in zip(stages, bare)]
+    names = [f"stage{n}" for n in range(len(stages))]
+    params = "arg" if _arity_one(funcs[0]) else "*args"
+    lines = [
+        f"def composed({params}):",
+        f"    r = {names[0]}({params})",
+    ]
+    for n, name in enumerate(names):
+        if n:
+            lines.append(f"    r = {name}(r)")
+        if bare[n]:
+            lines += [
+                "    if isinstance(r, Failure):",
+                "        return r  # Short-circuit",
+            ]
+        elif n < len(names) - 1:
+            lines += [
+                "    if not r.success:",
+                "        return r  # Short-circuit",
+                "    r = r.answer",
+            ]
+    lines.append(f"    return {'Success(r)' if bare[-1] else 'r'}")
+    namespace: dict = dict(zip(names, funcs))
+    namespace.update(Failure=Failure, Success=Success)
+    exec("\n".join(lines), namespace)
+    composed = namespace["composed"]
+    # Names the pipeline in bind_metrics and reprs:
+    stage_names = (getattr(f, "__qualname__", "?") for f in funcs)
+    composed.__qualname__ = f"compose({', '.join(stage_names)})"
+    return composed
+
+
+if __name__ == "__main__":
+    from validate_output import console
+
+    def half(i: int) -> Result[int, str]:
+        if i % 2:
+            return Failure(f"half({i})")
+        return Success(i // 2)
+
+    print(safe_map(lambda i: 1 / (i - 1), range(3)))
+    console == """
+[<Success: -1.0>, <Failure: division by zero>, <Success: 1.0>]
+"""
+
+    print(traverse(half, [2, 4, 6]))
+    print(traverse(half, [2, 3, 5]))
+    print(sequence(map(half, [2, 3, 5]), accumulate=True))
+    console == """
+<Success: [1, 2, 3]>
+<Failure: half(3)>
+<Failure: ['half(3)', 'half(5)']>
+"""
+
+    quarter = compose(half, half)
+    print([quarter(i) for i in [8, 6, 5]])
+
+    @Bare
+    def bare_half(i: int) -> int | Failure[int, str]:
+        if i % 2:
+            return Failure(f"bare_half({i})")
+        return i // 2
+
+    eighth = compose(half, bare_half, Bare(lambda i: i // 2))
+    print([eighth(i) for i in [16, 12, 6]])
+    console == """
+[<Success: 2>, <Failure: half(3)>, <Failure: half(5)>]
+[<Success: 2>, <Success: 1>, <Failure: bare_half(3)>]
+"""
@@ -1,29 +1,91 @@
 #: result_with_bind.py
-from dataclasses import dataclass
-from typing import Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 ANSWER = TypeVar("ANSWER")
 ERROR = TypeVar("ERROR")
 
 
-@dataclass(frozen=True)
+class UnwrapFailedError(Exception):
+    "Raised by unwrap() on a Failure"
+
+    def __init__(self, failure: "Failure"):
+        super().__init__(failure)
+        self.failure = failure
+
+
 class Result(Generic[ANSWER, ERROR]):
+    # No per-instance __dict__; immutable after creation:
+    __slots__ = ()
+    success: bool  # Tag: True for Success, False for Failure
+
     def bind(
         self, func: Callable[[ANSWER], "Result"]
     ) -> "Result[ANSWER, ERROR]":
-        if isinstance(self, Success):
-            return func(self.unwrap())
+        if self.success:
+            return func(self.answer)  # type: ignore
         return self  # Pass the Failure forward
 
+    def unwrap(self) -> ANSWER:
+        if self.success:
+            return self.answer  # type: ignore
+        raise UnwrapFailedError(self)  # type: ignore
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"{type(self).__name__} is immutable"
+        )
+
+    __delattr__ = __setattr__  # type: ignore[assignment]
+
 
-@dataclass(frozen=True)
 class Success(Result[ANSWER, ERROR]):
+    __slots__ = ("answer",)
     answer: ANSWER
+    __match_args__ = ("answer",)
+    success = True
 
-    def unwrap(self) -> ANSWER:
-        return self.answer
+    def __init__(self, answer: ANSWER):
+        _set_answer(self, answer)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.answer == other.answer  # type: ignore
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((True, self.answer))
+
+    def __repr__(self) -> str:
+        return f"Success(answer={self.answer!r})"
+
+    def __reduce__(self):
+        return Success, (self.answer,)
 
 
-@dataclass(frozen=True)
 class Failure(Result[ANSWER, ERROR]):
+    __slots__ = ("error",)
     error: ERROR
+    __match_args__ = ("error",)
+    success = False
+
+    def __init__(self, error: ERROR):
+        _set_error(self, error)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.error == other.error  # type: ignore
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((False, self.error))
+
+    def __repr__(self) -> str:
+        return f"Failure(error={self.error!r})"
+
+    def __reduce__(self):
+        return Failure, (self.error,)
+
+
+# Slot setters bypass the immutable __setattr__:
+_set_answer = Success.answer.__set__  # type: ignore
+_set_error = Failure.error.__set__  # type: ignore
@@ -0,0 +1,93 @@
+#: script_cache.py
+# Remember which scripts passed, keyed by a hash of everything
+# that could change their behavior.
+import ast
+import hashlib
+import json
+import sys
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Set
+
+cache_path = Path(__file__).with_name(".script_cache.json")
+
+
+def imported_names(script_path: Path) -> Set[str]:
+    "Top-level module names imported anywhere in the script"
+    tree = ast.parse(script_path.read_text(encoding="utf-8"))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(a.name.split(".")[0] for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            if node.level == 0:
+                names.add(node.module.split(".")[0])
+    return names
+
+
+@cache
+def _distributions() -> Dict[str, list]:
+    return metadata.packages_distributions()
+
+
+def _version(name: str) -> str | None:
+    "Installed distribution version(s) for a module, if any"
+    dists = _distributions().get(name)
+    if not dists:
+        return None  # Standard library or not installed
+    return ",".join(
+        f"{d}=={metadata.version(d)}" for d in sorted(set(dists))
+    )
+
+
+def script_key(script_path: Path) -> str:
+    """
+    Hash of the script, its transitive local imports (sibling
+    .py files), the interpreter version and the versions of
+    third-party packages they import.
+    """
+    local_dir = script_path.parent
+    seen: Dict[str, Path] = {}
+    external: Set[str] = set()
+    pending = [script_path]
+    while pending:
+        path = pending.pop()
+        if path.name in seen:
+            continue
+        seen[path.name] = path
+        for name in imported_names(path):
+            local = local_dir / f"{name}.py"
+            if local.exists():
+                pending.append(local)
+            else:
+                external.add(name)
+    digest = hashlib.sha256(sys.version.encode())
+    for name in sorted(seen):
+        digest.update(name.encode())
+        digest.update(seen[name].read_bytes())
+    for name in sorted(external):
+        digest.update(f"{name}:{_version(name)}".encode())
+    return digest.hexdigest()
+
+
+class ScriptCache:
+    "file name -> key of the last passing run"
+
+    def __init__(self, path: Path = cache_path):
+        self.path = path
+        try:
+            self.passed: Dict[str, str] = json.loads(
+                path.read_text()
+            )
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.passed = {}
+
+    def unchanged(self, file_name: str, key: str) -> bool:
+        return self.passed.get(file_name) == key
+
+    def record(self, file_name: str, key: str) -> None:
+        self.passed[file_name] = key
+        self.path.write_text(
+            json.dumps(self.passed, indent=2, sort_keys=True)
+        )
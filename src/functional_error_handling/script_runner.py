@@ -0,0 +1,97 @@
+#: script_runner.py
+# Run example scripts in parallel, in pre-warmed worker processes
+import io
+import multiprocessing
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+# Preloaded once by the fork server so every worker starts warm:
+warm_modules = ["pprint", "result_lib", "script_runner"]
+
+
+@dataclass
+class ScriptRun:
+    file_name: str
+    passed: bool  # Script exited cleanly (or raised, if expected)
+    seconds: float
+    stdout: str
+    stderr: str
+
+
+def _run_one(
+    script_dir: str, file_name: str, throws_exception: bool
+) -> ScriptRun:
+    "Runs inside a worker that handles exactly one script"
+    stdout, stderr = io.StringIO(), io.StringIO()
+    sys.stdout, sys.stderr = stdout, stderr
+    sys.path.insert(0, script_dir)
+    sys.argv = [file_name]
+    raised = False
+    start = time.perf_counter()
+    try:
+        runpy.run_path(
+            str(Path(script_dir) / file_name), run_name="__main__"
+        )
+    except SystemExit as e:
+        raised = e.code not in (None, 0)
+    except BaseException:
+        raised = True
+        traceback.print_exc(file=stderr)
+    seconds = time.perf_counter() - start
+    sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    return ScriptRun(
+        file_name,
+        raised == throws_exception,
+        seconds,
+        stdout.getvalue(),
+        stderr.getvalue(),
+    )
+
+
+def run_scripts(
+    scripts: Dict[str, bool], workers: int | None = None
+) -> List[ScriptRun]:
+    """
+    `scripts` maps file name -> whether it should raise.
+    Each script gets a fresh worker (max_tasks_per_child=1), so
+    module state never leaks between scripts. Where the
+    `forkserver` start method exists (not on Windows), workers
+    are forked from a server that has imported warm_modules.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(warm_modules)
+    else:
+        context = multiprocessing.get_context("spawn")
+    script_dir = str(Path(__file__).parent)
+    # Not a multiprocessing.Pool: its daemonic workers could not
+    # run scripts that start processes of their own.
+    with ProcessPoolExecutor(
+        workers, mp_context=context, max_tasks_per_child=1
+    ) as pool:
+        return list(
+            pool.map(
+                _run_one,
+                [script_dir] * len(scripts),
+                scripts.keys(),
+                scripts.values(),
+            )
+        )
+
+
+def report(runs: List[ScriptRun], wall_seconds: float) -> bool:
+    "Print per-script timing and any failure output"
+    for run in sorted(runs, key=lambda r: -r.seconds):
+        status = "passed" if run.passed else "FAILED"
+        print(f"{run.file_name:<24}{run.seconds:>8.3f}s  {status}")
+        if not run.passed:
+            print(run.stdout)
+            print(run.stderr)
+    print(f"{'wall time':<24}{wall_seconds:>8.3f}s")
+    return all(run.passed for run in runs)
@@ -4,12 +4,21 @@
 # python update_output.py *
 # Update foo.py and bar.py:
 # python update_output.py foo.py bar.py
+# Keep running, updating changed scripts and their importers:
+# python update_output.py * --watch
 import argparse
+import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Set, Tuple
+
+from script_cache import imported_names
 
 console_pattern = re.compile(r'console\s*==\s*"""[\s\S]*?"""')
 console_import_line = "from validate_output import console"
@@ -26,20 +35,6 @@ def debug(*msgs: str, title: str | None = None) -> None:
             print(msg)
 
 
-def test_script(script_path: Path) -> bool:
-    "Check script to see if it already works"
-    print(f"Checking: {script_path} ", end="")
-    result = subprocess.run(
-        [sys.executable, str(script_path)], capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        print(" ... failed")
-        return False
-    else:
-        print(" ... passed")
-        return True
-
-
 def clear_script_output(script_path: Path) -> None:
     debug(title=f"Clearing {script_path}")
     original_script = script_path.read_text()
@@ -52,62 +47,82 @@ def clear_script_output(script_path: Path) -> None:
     print(f"Cleared {script_path}")
 
 
-def capture_script_output(script_path: Path, temp_content: str) -> str:
-    "Temporarily rewrite the script for output capture, run it, then restore original"
-    original_content = script_path.read_text()
-    script_path.write_text(temp_content)  # temp_content does not redirect output
+# Runs source read from stdin as if it were the script itself:
+runner = """
+import sys, types
+path = sys.argv[1]
+sys.argv = sys.argv[1:]
+main = types.ModuleType("__main__")  # So pickle can find its functions
+main.__file__ = path
+sys.modules["__main__"] = main
+exec(compile(sys.stdin.read(), path, "exec"), main.__dict__)
+"""
 
-    try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)], capture_output=True, text=True
-        )
-        # Check if the script ran successfully
-        if result.returncode != 0:
-            print(" Temporary script failed ".center(50, "-"))
-            print(temp_content)
-            sys.exit(result.returncode)
-        return result.stdout
-    finally:  # Always restore original
-        script_path.write_text(original_content)
-
-
-def update_script_with_output(script_path: Path, outputs: List[str]) -> bool:
-    "Update 'console ==' lines with the new outputs"
-    original_script = script_path.read_text()
-    modified_script = original_script
-    matches = list(console_pattern.finditer(original_script))
-    # Replace the console placeholders with delimiter prints in the temp script
-    for match in matches:
-        debug(f"{match.group(0) = }")
-        modified_script = modified_script.replace(
-            match.group(0), f'print("{output_section_delimiter}")', 1
-        )
-    debug(modified_script, title="modified_script")
-    if __debug:
-        modified_script_path = script_path.with_name(script_path.stem + "_modified.py")
-        print(f"{modified_script_path = }")
-        modified_script_path.write_text(modified_script)
-
-    # Capture output using the modified script
-    output = capture_script_output(script_path, modified_script)
-    debug(output, title="output")
-    output_sections = output.split(output_section_delimiter)
-    for output_section in output_sections:
-        debug(f"{output_section = }")
-
-    # Update original script with new outputs
-    modified_script = original_script
-    for match, new_output in zip(matches, output_sections):
-        debug(f"{match.group(0) = }\n\t{new_output = }")
-        modified_script = modified_script.replace(
-            match.group(0), f'console == """\n{new_output.strip()}\n"""', 1
-        )
-    debug(modified_script, title="modified_script")
-
-    if modified_script != original_script:
-        script_path.write_text(modified_script)
-        return True  # Changes made
-    return False  # No changes made
+
+def run_in_memory(
+    script_path: Path, source: str
+) -> subprocess.CompletedProcess:
+    "Run `source` in place of script_path without touching the file"
+    return subprocess.run(
+        [sys.executable, "-c", runner, str(script_path.resolve())],
+        input=source,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,  # Interleaved, like console ==
+        text=True,
+        cwd=script_path.resolve().parent,
+    )
+
+
+def atomic_write(path: Path, text: str) -> None:
+    "Write a sibling temp file, then rename it over path"
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+    ) as temp:
+        temp.write(text)
+    # The temp file is created 0600; keep path's permissions:
+    shutil.copymode(path, temp.name)
+    os.replace(temp.name, path)
+
+
+def update_script(script_path: Path) -> bool:
+    """
+    Run the script once with each 'console ==' replaced by a
+    delimiter print, then splice the captured sections back in,
+    unless the file was edited meanwhile. Returns True if the
+    file changed.
+    """
+    original_script = script_path.read_text(encoding="utf-8")
+    marked_script = console_pattern.sub(
+        f'print("{output_section_delimiter}")',
+        original_script.replace(console_import_line, "console = ''"),
+    )
+    debug(marked_script, title="marked_script")
+    running = f"Running: {script_path} "  # One print per script
+    result = run_in_memory(script_path, marked_script)
+    if result.returncode != 0:
+        print(f"{running} ... failed\n{result.stdout}")
+        sys.exit(result.returncode)
+    debug(result.stdout, title="output")
+    sections = iter(result.stdout.split(output_section_delimiter))
+    section_count = len(console_pattern.findall(original_script))
+    if result.stdout.count(output_section_delimiter) != section_count:
+        print(f"{running} ... skipped: each 'console ==' must run once")
+        return False
+    updated_script = console_pattern.sub(
+        lambda _: f'console == """\n{next(sections).strip()}\n"""',
+        original_script,
+    )
+    if updated_script == original_script:
+        print(f"{running} ... passed")
+        return False
+    if script_path.read_text(encoding="utf-8") != original_script:
+        # Edited while it ran; don't overwrite the edit.
+        # In --watch mode, the next round picks it up.
+        print(f"{running} ... skipped: changed while running")
+        return False
+    atomic_write(script_path, updated_script)
+    print(f"{running} ... updated")
+    return True
 
 
 def main(file_args: List[str], clear: bool):
@@ -120,18 +135,95 @@ def main(file_args: List[str], clear: bool):
                     if clear:
                         clear_script_output(file)
                         continue  # Do not process this file
-                    if not test_script(file):
-                        temp_content = content.replace(
-                            console_import_line, "console = ''"
-                        )
-                        output = capture_script_output(file, temp_content)
-                        outputs = [
-                            out.strip() for out in output.split("\n") if out.strip()
-                        ]
-                        if update_script_with_output(file, outputs):
-                            print(f"\t{file} updated with console outputs.")
-                        else:
-                            print(f"\t(No changes to {file})")
+                    if update_script(file):
+                        print(f"\t{file} updated with console outputs.")
+                    else:
+                        print(f"\t(No changes to {file})")
+
+
+def import_graph(files: List[Path]) -> Dict[Path, Set[Path]]:
+    "Each file -> the local files that import it directly"
+    by_name = {file.stem: file for file in files}
+    importers: Dict[Path, Set[Path]] = {file: set() for file in files}
+    for file in files:
+        for name in imported_names(file):
+            if name in by_name:
+                importers[by_name[name]].add(file)
+    return importers
+
+
+def affected_by(
+    changed: Set[Path], importers: Dict[Path, Set[Path]]
+) -> Set[Path]:
+    "Changed files plus everything that imports them, transitively"
+    affected: Set[Path] = set()
+    pending = list(changed)
+    while pending:
+        file = pending.pop()
+        if file not in affected:
+            affected.add(file)
+            pending.extend(importers.get(file, ()))
+    return affected
+
+
+def timed_update(script_path: Path) -> Tuple[float, bool]:
+    "Seconds taken, and whether the file was rewritten"
+    start = time.perf_counter()
+    rewritten = False
+    try:
+        rewritten = update_script(script_path)
+    except SystemExit:  # Script failed; already reported
+        pass
+    return time.perf_counter() - start, rewritten
+
+
+def watch(
+    file_args: List[str], interval: float, workers: int | None
+) -> None:
+    "Poll for changes; rerun changed scripts and their dependents"
+    this_script_name = Path(__file__).name
+
+    def scan() -> Dict[Path, int]:
+        return {
+            file: file.stat().st_mtime_ns
+            for file in Path(".").glob("*.py")
+            if file.name != this_script_name
+        }
+
+    def targets() -> Set[Path]:
+        return {
+            file
+            for pattern in file_args
+            for file in Path(".").glob(pattern)
+            if file.name.endswith(".py")
+            and file.name != this_script_name
+            and console_import_line in file.read_text(encoding="utf-8")
+        }
+
+    mtimes = scan()
+    print(f"Watching {len(mtimes)} files (Ctrl-C to stop)")
+    with ThreadPoolExecutor(workers) as pool:
+        while True:
+            time.sleep(interval)
+            current = scan()
+            changed = {
+                file
+                for file, mtime in current.items()
+                if mtimes.get(file) != mtime
+            }
+            if not changed:
+                continue
+            importers = import_graph(list(current))
+            to_update = sorted(affected_by(changed, importers) & targets())
+            start = time.perf_counter()
+            updates = list(pool.map(timed_update, to_update))
+            elapsed = time.perf_counter() - start
+            mtimes = current
+            for file, (seconds, rewritten) in zip(to_update, updates):
+                print(f"\t{file}: {seconds:.3f}s")
+                if rewritten:  # Ignore our own rewrites, only
+                    mtimes[file] = file.stat().st_mtime_ns
+            print(f"Checked {len(to_update)} scripts in {elapsed:.3f}s")
 
 
 if __name__ == "__main__":
@@ -144,6 +236,23 @@ if __name__ == "__main__":
         action="store_true",
         help="Clear outputs instead of updating them",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running; update scripts when they or their imports change",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for changes in --watch mode",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Scripts run in parallel in --watch mode",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -155,4 +264,7 @@ if __name__ == "__main__":
     if args.debug:
         print("Debugging")
         __debug = True
-    main(args.files, args.clear)
+    if args.watch:
+        watch(args.files, args.interval, args.workers)
+    else:
+        main(args.files, args.clear)
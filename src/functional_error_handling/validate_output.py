@@ -6,25 +6,198 @@
 # Update scripts using: python update_output.py *
 import atexit
 import sys
-from io import StringIO
+from collections import deque
+from itertools import chain, zip_longest
+from typing import Any, Iterable, Iterator, List, TextIO
+
+
+class CaptureBuffer:
+    """
+    Holds captured text in memory up to `max_memory` characters,
+    then spills everything to a temporary file that is read back
+    through a memory map. Once spilled, it also hashes the text
+    as it arrives, exactly as if it had been strip()ped, so
+    matches() need not read the file back.
+    """
+
+    def __init__(self, max_memory: int = 1 << 20):
+        self.max_memory = max_memory
+        self.chunks: List[str] = []
+        self.size = 0
+        self.spill_file: Any = None
+        self.digest: Any = None  # Created on spilling
+        self.started = False  # Seen non-whitespace yet?
+        self.held = ""  # Trailing whitespace, not yet hashed
+
+    def _hash(self, data: str) -> None:
+        if not self.started:
+            data = data.lstrip()
+            if not data:
+                return
+            self.started = True
+        stripped = data.rstrip()
+        if stripped:
+            self.digest.update((self.held + stripped).encode("utf-8"))
+            self.held = data[len(stripped) :]
+        else:
+            self.held += data
+
+    def matches(self, expected: str) -> bool:
+        "getvalue().strip() == expected, which must be stripped"
+        if self.digest is None:
+            return "".join(self.chunks).strip() == expected
+        import hashlib
+
+        wanted = hashlib.sha256(expected.encode("utf-8"))
+        return self.digest.hexdigest() == wanted.hexdigest()
+
+    def write(self, data: str) -> None:
+        if self.spill_file is not None:
+            self._hash(data)
+            self.spill_file.write(data.encode("utf-8"))
+            return
+        self.chunks.append(data)
+        self.size += len(data)
+        if self.size > self.max_memory:
+            # Only now: keeps startup fast
+            import hashlib
+            import tempfile
+
+            text = "".join(self.chunks)
+            self.digest = hashlib.sha256()
+            self._hash(text)
+            self.spill_file = tempfile.TemporaryFile()
+            self.spill_file.write(text.encode("utf-8"))
+            self.chunks = []
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        if self.spill_file is None:
+            return "".join(self.chunks)
+        self.spill_file.flush()
+        if self.spill_file.tell() == 0:
+            return ""
+        import mmap
+
+        with mmap.mmap(
+            self.spill_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            return mapped[:].decode("utf-8")
+
+    def lines(self) -> Iterator[str]:
+        "Captured lines, without holding a spilled file in memory"
+        if self.spill_file is None:
+            yield from "".join(self.chunks).splitlines()
+            return
+        self.spill_file.flush()
+        self.spill_file.seek(0)
+        for line in self.spill_file:
+            yield line.decode("utf-8").rstrip("\r\n")
+
+    def close(self) -> None:
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+        self.chunks = []
+
+
+def first_difference(
+    captured: Iterable[str],
+    expected: Iterable[str],
+    context: int = 2,
+) -> str:
+    """
+    Walk both texts line by line, as if strip()ped, and describe
+    the first line that differs, with preceding lines for context.
+    """
+    captured = iter(captured)
+    for line in captured:  # Skip leading whitespace
+        if line.strip():
+            captured = chain([line.lstrip()], captured)
+            break
+    before: deque = deque(maxlen=context)
+    for number, (got, wanted) in enumerate(
+        zip_longest(captured, expected), 1
+    ):
+        if wanted is None and not got.strip():
+            continue  # Trailing whitespace
+        if got == wanted:
+            before.append(got)
+            continue
+        end = "<end of output>"
+        report = [f"\nFirst difference at line {number}:"]
+        report += [f"  {line}" for line in before]
+        report.append(f"Expected: {end if wanted is None else wanted}")
+        report.append(f"Got:      {end if got is None else got}")
+        return "\n".join(report)
+    return "\nOutputs differ only in whitespace"
 
 
 class TeeStream:
-    def __init__(self, main_stream, capture_stream):
+    """
+    Mirrors writes to main_stream and captures them. Output to
+    main_stream is buffered according to flush_policy:
+      "line": flush at each newline (default)
+      "size": flush once buffer_size characters are pending
+      "always": write through on every call
+    """
+
+    def __init__(
+        self,
+        main_stream: TextIO,
+        *capture_streams: CaptureBuffer,
+        flush_policy: str = "line",
+        buffer_size: int = 8192,
+    ):
+        assert flush_policy in ("line", "size", "always")
         self.main_stream = main_stream
-        self.capture_stream = capture_stream
+        self.capture_streams = capture_streams
+        self.flush_policy = flush_policy
+        self.buffer_size = buffer_size
+        self.pending: List[str] = []
+        self.pending_size = 0
 
-    def write(self, data: str):
-        self.main_stream.write(data)
-        self.capture_stream.write(data)
+    def write(self, data: str) -> int:
+        for capture in self.capture_streams:
+            capture.write(data)
+        if self.flush_policy == "always":
+            self.main_stream.write(data)
+            return len(data)
+        self.pending.append(data)
+        self.pending_size += len(data)
+        if self.pending_size >= self.buffer_size or (
+            self.flush_policy == "line" and "\n" in data
+        ):
+            self.flush()
+        return len(data)
 
-    def flush(self):
+    def flush(self) -> None:
+        if self.pending:
+            self.main_stream.write("".join(self.pending))
+            self.pending = []
+            self.pending_size = 0
         self.main_stream.flush()
-        self.capture_stream.flush()
 
 
 class OutputValidator:
-    def __init__(self):
+    """
+    Captures stdout and stderr together for `console ==`.
+    With keep_channels=True, `stdout` and `stderr` also hold
+    each stream's output (since the last `console ==`)
+    separately.
+    """
+
+    def __init__(
+        self,
+        flush_policy: str = "line",
+        max_memory: int = 1 << 20,
+        keep_channels: bool = False,
+    ):
+        self.flush_policy = flush_policy
+        self.max_memory = max_memory
+        self.keep_channels = keep_channels
         self.start()
         atexit.register(self.stop)
 
@@ -32,9 +205,24 @@ class OutputValidator:
         "Capture and mirror output"
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
-        self.captured_output = StringIO()
-        sys.stdout = TeeStream(self.original_stdout, self.captured_output)
-        sys.stderr = TeeStream(self.original_stderr, self.captured_output)
+        self.captured_output = CaptureBuffer(self.max_memory)
+        stdout_captures = [self.captured_output]
+        stderr_captures = [self.captured_output]
+        if self.keep_channels:
+            self.stdout = CaptureBuffer(self.max_memory)
+            self.stderr = CaptureBuffer(self.max_memory)
+            stdout_captures.append(self.stdout)
+            stderr_captures.append(self.stderr)
+        sys.stdout = TeeStream(
+            self.original_stdout,
+            *stdout_captures,
+            flush_policy=self.flush_policy,
+        )
+        sys.stderr = TeeStream(
+            self.original_stderr,
+            *stderr_captures,
+            flush_policy=self.flush_policy,
+        )
 
     def stop(self):
         "Restore original stdout and stderr"
@@ -48,13 +236,50 @@ class OutputValidator:
         # Standard __eq__ requires `other` to be an object:
         assert isinstance(other, str), f"{other} must be str for console =="
         self.stop()
-        captured_text = self.captured_output.getvalue().strip()
         expected_text = other.strip()
-        assert (
-            captured_text == expected_text
-        ), f"\nExpected:\n{expected_text}\nGot:\n{captured_text}"
+        captured = self.captured_output
+        if not captured.matches(expected_text):
+            # Only now look at the text line by line:
+            message = first_difference(
+                captured.lines(), expected_text.splitlines()
+            )
+            captured.close()
+            raise AssertionError(message)
+        captured.close()
         self.start()
         return True
 
 
 console = OutputValidator()  # Global to use in scripts
+
+if __name__ == "__main__":
+    # With a tiny max_memory, capture spills to a file and is
+    # compared by hash; a mismatch is found by reading it back.
+    spilling = OutputValidator(max_memory=16)
+    print("more than sixteen characters")
+    print(spilling.captured_output.spill_file is not None)
+    spilling == """
+more than sixteen characters
+True
+"""
+    print("first line")
+    print("second line, spilled")
+    try:
+        spilling == """
+first line
+expected line
+"""
+    except AssertionError as e:
+        report = str(e)
+    print(report)
+    console == """
+more than sixteen characters
+True
+first line
+second line, spilled
+
+First difference at line 2:
+  first line
+Expected: expected line
+Got:      second line, spilled
+"""
@@ -1,17 +1,86 @@
 #: update_markdown_code_listings.py
 import argparse
 import difflib
+import hashlib
+import json
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from pprint import pformat
-from typing import List
+from typing import Any, Dict, List, Set, Tuple
 
 from rich.console import Console
+from rich.markup import escape
 
 width = 65
 console = Console()
 python_files = []
+quiet = False  # Only print the summary
+diff_context: int | None = 3  # None: full Differ output
+# Source file stamps, so unchanged sources are never read:
+stamps_path = Path(__file__).with_name(".listing_stamps.json")
+source_stamps: Dict[str, dict] = {}
+# Per document: its stamp and the source hashes it was synced to:
+manifest_path = Path(__file__).with_name(".listing_manifest.json")
+manifest: Dict[str, dict] = {}
+
+
+class DocumentOutput:
+    """
+    One document's console output, held until the document is
+    done so parallel documents don't interleave their output.
+    """
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[tuple, dict]] = []
+
+    def print(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append((args, kwargs))
+
+    def replay(self) -> None:
+        for args, kwargs in self.calls:
+            console.print(*args, **kwargs)
+
+
+_document = threading.local()  # .output while syncing a document
+
+
+def output() -> Any:
+    "The current document's buffer, or the console itself"
+    return getattr(_document, "output", console)
+
+
+def listing_hash(listing: str) -> str:
+    return hashlib.sha256(listing.encode("utf-8")).hexdigest()
+
+
+def source_hash(source_file_path: Path) -> str:
+    """
+    listing_hash() of the source as a markdown listing. The
+    file is only read if it changed since it was stamped.
+    """
+    stat = source_file_path.stat()
+    key = str(source_file_path.resolve())
+    stamp = source_stamps.get(key)
+    if (
+        stamp is None
+        or stamp["mtime_ns"] != stat.st_mtime_ns
+        or stamp["size"] != stat.st_size
+    ):
+        listing = (
+            "```python\n"
+            + source_file_path.read_text(encoding="utf-8")
+            + "```"
+        )
+        stamp = source_stamps[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": listing_hash(listing),
+        }
+    return stamp["sha256"]
 
 
 @dataclass
@@ -20,103 +89,132 @@ class MarkdownListing:
     markdown_listing: str
     source_file_path: Path | None
     # Exclude field from constructor arguments:
-    source_file_contents: str = field(init=False)
     changed: bool = field(init=False)
-    diffs: str = field(init=False)
+    _source_file_contents: str | None = field(
+        init=False, default=None, repr=False
+    )
 
     def __post_init__(self):
         if self.source_file_path is None:
-            console.print(
+            output().print(
                 "[bold red] MarkdownListing: source_file_path is None"
                 f" for slugname: {self.slugname}[/bold red]"
             )
-            console.print(pformat(python_files))
+            output().print(pformat(python_files))
             raise ValueError("source_file cannot be None")
-        self.source_file_contents = (
-            "```python\n"
-            + self.source_file_path.read_text(
-                encoding="utf-8"
-            )
-            + "```"
-        )
-        self.changed = (
+        self.changed = listing_hash(
             self.markdown_listing
-            != self.source_file_contents
-        )
-        if self.changed:
-            # Compute the differences between markdown_listing and source_file_contents
-            differ = difflib.Differ()
-            diff_lines = list(
-                differ.compare(
-                    self.markdown_listing.splitlines(
-                        keepends=True
-                    ),
-                    self.source_file_contents.splitlines(
-                        keepends=True
-                    ),
+        ) != source_hash(self.source_file_path)
+
+    @property
+    def source_file_contents(self) -> str:
+        if self._source_file_contents is None:
+            assert self.source_file_path is not None
+            self._source_file_contents = (
+                "```python\n"
+                + self.source_file_path.read_text(
+                    encoding="utf-8"
                 )
+                + "```"
             )
-            # Format the differences for display
-            self.diffs = "".join(diff_lines)
+        return self._source_file_contents
+
+    @property
+    def diffs(self) -> str:
+        "Computed only when displayed"
+        old = self.markdown_listing.splitlines(keepends=True)
+        new = self.source_file_contents.splitlines(
+            keepends=True
+        )
+        if diff_context is None:  # Full listing, line by line
+            return "".join(difflib.Differ().compare(old, new))
+        return "".join(
+            difflib.unified_diff(
+                old,
+                new,
+                "markdown",
+                self.slugname,
+                n=diff_context,
+            )
+        )
 
     def __str__(self):
         return f"""
 Filename from slugline: {self.slugname}
 Source File: {self.source_file_path.absolute() if self.source_file_path else ""}
 {self.changed = }
-{"  Markdown Code Listing  ".center(width, "-")}[chartreuse4]
-{self.markdown_listing}[/chartreuse4]
-{"  Source File Code Listing  ".center(width, "-")}[chartreuse4]
-{self.source_file_contents}[/chartreuse4]
 {"  diffs  ".center(width,"v")}[chartreuse4]
-{self.diffs}[/chartreuse4]
+{escape(self.diffs)}[/chartreuse4]
 {'=' * width}
 """
 
 
-def find_python_files_and_listings(
-    markdown_content: str,
-) -> List[MarkdownListing]:
+code_location_pattern = re.compile(
+    r"#\[code_location\]\s*(.*)\s*-->"
+)
+# If slug line doesn't exist group(1) returns None:
+listing_pattern = re.compile(
+    r"```python\n(#\:(.*?)\n)?(.*?)```", re.DOTALL
+)
+
+
+def build_source_index(
+    *markdown_contents: str,
+) -> Dict[str, Path]:
     """
-    Find all #[code_location] paths in the markdown content and
-    return associated Python files and listings.
+    Find all #[code_location] paths in the markdown contents and
+    index the Python files beneath them by file name. A name
+    found at more than one path is reported and left out, so
+    listings that use it fail loudly instead of picking one.
     """
     global python_files
-    listings = []
-
-    code_location_pattern = re.compile(
-        r"#\[code_location\]\s*(.*)\s*-->"
-    )
-
+    found: Dict[str, Set[Path]] = {}
     for match in re.finditer(
-        code_location_pattern, markdown_content
+        code_location_pattern, "\n".join(markdown_contents)
     ):
-        code_location = Path(match.group(1))
-        if code_location.is_absolute():
-            python_files.extend(
-                list(code_location.glob("**/*.py"))
+        code_location = Path(match.group(1).strip())
+        if not code_location.is_absolute():
+            code_location = (Path.cwd() / code_location).resolve()
+        for pyfile in code_location.glob("**/*.py"):
+            found.setdefault(pyfile.name, set()).add(
+                pyfile.resolve()
             )
-        else:  # Relative path:
-            python_files.extend(
-                list(
-                    (Path.cwd() / code_location)
-                    .resolve()
-                    .glob("**/*.py")
-                )
+    index = {}
+    for name, paths in sorted(found.items()):
+        if len(paths) > 1:
+            console.print(
+                f"[bold red]Duplicate file name {name}:[/bold red]"
             )
+            for path in sorted(paths):
+                console.print(f"\t[bold red]{path}[/bold red]")
+        else:
+            index[name] = paths.pop()
+    python_files = list(index.values())
+    if quiet:
+        return index
     console.print(
         f"[orange3]{"  Available Python Files  ".center(width, "-")}[/orange3]"
     )
-    for pyfile in [pf.name for pf in python_files]:
+    for pyfile in index:
         console.print(
             f"\t[sea_green2]{pyfile}[/sea_green2]"
         )
     console.print(f"[orange3]{"-" * width}[/orange3]")
+    return index
 
-    # If slug line doesn't exist group(1) returns None:
-    listing_pattern = re.compile(
-        r"```python\n(#\:(.*?)\n)?(.*?)```", re.DOTALL
-    )
+
+def find_python_files_and_listings(
+    markdown_content: str,
+    source_index: Dict[str, Path] | None = None,
+) -> List[MarkdownListing]:
+    """
+    Return a MarkdownListing for each slugline-marked listing,
+    in document order. Builds a source index unless one is
+    passed in (shared by several documents).
+    """
+    if source_index is None:
+        source_index = build_source_index(markdown_content)
+    listings = []
     for match in re.finditer(
         listing_pattern, markdown_content
     ):
@@ -132,17 +230,11 @@ def find_python_files_and_listings(
             assert (
                 filename
             ), f"filename not found in {match}"
-            source_file = next(
-                (
-                    file
-                    for file in python_files
-                    if file.name == filename
-                ),
-                None,
-            )
             listings.append(
                 MarkdownListing(
-                    filename, listing_content, source_file
+                    filename,
+                    listing_content,
+                    source_index.get(filename),
                 )
             )
     return listings
@@ -151,67 +243,213 @@ def find_python_files_and_listings(
 def update_markdown_listings(
     markdown_content: str, listings: List[MarkdownListing]
 ) -> str:
-    updated_markdown = markdown_content
-    for listing in listings:
+    """
+    Rebuild the markdown in one pass over the listing matches,
+    which line up one-to-one with `listings`.
+    """
+    remaining = iter(listings)
+
+    def replace(match: re.Match) -> str:
+        if match.group(1) is None:
+            return match.group(0)  # No slugline: leave alone
+        listing = next(remaining)
         if not listing.changed:
-            console.print(
-                f"[bold green]{listing.slugname}[/bold green]"
-            )
-        if listing.changed:
-            console.print(
+            if not quiet:
+                output().print(
+                    f"[bold green]{listing.slugname}[/bold green]"
+                )
+            return match.group(0)
+        if not quiet:
+            output().print(
                 f"[bold red]{listing.slugname}[/bold red]"
             )
-            console.print(
+            output().print(
                 f"[bright_cyan]{listing}[/bright_cyan]"
             )
-            updated_markdown = updated_markdown.replace(
-                listing.markdown_listing,
-                listing.source_file_contents,
-            )
-    return updated_markdown
+        return listing.source_file_contents
 
+    return listing_pattern.sub(replace, markdown_content)
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Update Python slugline-marked source-code listings within a markdown file."
-    )
-    parser.add_argument(
-        "markdown_file",
-        help="Path to the markdown file to be updated.",
-    )
-    args = parser.parse_args()
 
-    markdown_file = Path(args.markdown_file)
-    markdown_content = markdown_file.read_text(
-        encoding="utf-8"
+def load_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_json(path: Path, data: dict) -> None:
+    path.write_text(
+        json.dumps(data, indent=2, sort_keys=True),
+        encoding="utf-8",
     )
+
+
+def document_unchanged(markdown_file: Path) -> bool:
+    """
+    True if neither the document nor any source it lists has
+    changed since the manifest entry was recorded.
+    """
+    entry = manifest.get(str(markdown_file.resolve()))
+    if entry is None:
+        return False
+    stat = markdown_file.stat()
+    if (entry["mtime_ns"], entry["size"]) != (
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return False
+    try:
+        return all(
+            source_hash(Path(source)) == sha256
+            for source, sha256 in entry["sources"].items()
+        )
+    except FileNotFoundError:
+        return False
+
+
+def update_markdown_file(
+    markdown_file: Path,
+    markdown_content: str,
+    source_index: Dict[str, Path],
+) -> List[str]:
+    "Sync one document; returns the slugnames that changed"
     listings = find_python_files_and_listings(
-        markdown_content
+        markdown_content, source_index
     )
-    changes = [
-        True for listing in listings if listing.changed
+    changed = [
+        listing.slugname
+        for listing in listings
+        if listing.changed
     ]
-    if any(changes):
+    if changed:
         updated_markdown = update_markdown_listings(
             markdown_content, listings
         )
         markdown_file.write_text(
             updated_markdown, encoding="utf-8"
         )
-    change_count = f"  {changes.count(True)} changes made to {markdown_file}  ".center(
-        width, "-"
-    )
-    console.print(f"\n[orange3]{change_count}[/orange3]")
-    if any(changes):
-        for change in [
-            listing
+    stat = markdown_file.stat()
+    manifest[str(markdown_file.resolve())] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sources": {
+            str(listing.source_file_path.resolve()): source_hash(
+                listing.source_file_path
+            )
             for listing in listings
-            if listing.changed
-        ]:
+            if listing.source_file_path is not None
+        },
+    }
+    return changed
+
+
+def sync_document(
+    markdown_file: Path,
+    markdown_content: str,
+    source_index: Dict[str, Path],
+) -> Tuple[List[str], DocumentOutput, Exception | None]:
+    """
+    update_markdown_file() with its output buffered. An error
+    is returned rather than raised, so one bad document doesn't
+    stop the others; it gets no manifest entry.
+    """
+    _document.output = DocumentOutput()
+    try:
+        changes = update_markdown_file(
+            markdown_file, markdown_content, source_index
+        )
+        return changes, _document.output, None
+    except Exception as e:
+        return [], _document.output, e
+    finally:
+        del _document.output
+
+
+def main():
+    global quiet, diff_context, source_stamps, manifest
+    parser = argparse.ArgumentParser(
+        description="Update Python slugline-marked source-code listings within markdown files."
+    )
+    parser.add_argument(
+        "markdown_files",
+        nargs="+",
+        help="Paths to the markdown files to be updated.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the summary of changes.",
+    )
+    parser.add_argument(
+        "--context",
+        type=int,
+        default=3,
+        help="Lines of context in unified diffs.",
+    )
+    parser.add_argument(
+        "--full-diff",
+        action="store_true",
+        help="Show every line of changed listings (difflib.Differ).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Process every file, even if the manifest says it is current.",
+    )
+    args = parser.parse_args()
+    quiet = args.quiet
+    diff_context = None if args.full_diff else args.context
+    source_stamps = load_json(stamps_path)
+    manifest = load_json(manifest_path)
+
+    markdown_files = []
+    for markdown_file in map(Path, args.markdown_files):
+        if not args.force and document_unchanged(markdown_file):
             console.print(
-                f"[bright_cyan]{change.slugname}[/bright_cyan]"
+                f"[sea_green2]{markdown_file} is current[/sea_green2]"
+            )
+        else:
+            markdown_files.append(markdown_file)
+    contents = [
+        f.read_text(encoding="utf-8") for f in markdown_files
+    ]
+    source_index = build_source_index(*contents)
+    with ThreadPoolExecutor() as pool:
+        results = list(
+            pool.map(
+                sync_document,
+                markdown_files,
+                contents,
+                [source_index] * len(markdown_files),
             )
+        )
+    # Stamps and manifest entries of the documents that synced:
+    save_json(stamps_path, source_stamps)
+    save_json(manifest_path, manifest)
 
+    failed = []
+    for markdown_file, (changes, document_output, error) in zip(
+        markdown_files, results
+    ):
+        document_output.replay()
+        if error is not None:
+            failed.append(markdown_file)
+            console.print(
+                f"\n[bold red]{markdown_file} not updated:"
+                f" {escape(repr(error))}[/bold red]"
+            )
+            continue
+        change_count = f"  {len(changes)} changes made to {markdown_file}  ".center(
+            width, "-"
+        )
+        console.print(f"\n[orange3]{change_count}[/orange3]")
+        for slugname in changes:
+            console.print(
+                f"[bright_cyan]{slugname}[/bright_cyan]"
+            )
+    if failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()